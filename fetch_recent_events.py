@@ -18,15 +18,53 @@ Usage:
     python fetch_recent_events.py
 """
 
+import argparse
+import hashlib
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, List
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+# orjson serializes several times faster than stdlib json; fall back when
+# it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Fast path for decoding response bytes (orjson parses 2-5x faster than stdlib)
+_loads = orjson.loads if orjson is not None else json.loads
+
+# numpy lets the date sort run as a vectorized C argsort instead of Python
+# object comparisons; fall back to list.sort when it isn't installed
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# ciso8601 parses ISO-8601 (including the trailing Z) in C, far faster than
+# fromisoformat plus str.replace; fall back when it isn't installed
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+# brotli decoding is optional; br is only advertised when the package is
+# installed, since a server honoring it would otherwise send bodies the
+# client can't decode
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 # Meetup API uses MILES (not kilometers) with a silent cap at 100 miles
 MAX_RADIUS_MILES = 100
 
@@ -37,6 +75,24 @@ load_dotenv()
 MEETUP_API_TOKEN = os.getenv("MEETUP_API_TOKEN")
 MEETUP_API_ENDPOINT = os.getenv("MEETUP_API_ENDPOINT", "https://api.meetup.com/gql-ext")
 
+# Shared session so TCP connections and TLS sessions are reused across pages
+# instead of paying a fresh handshake per requests.post call. Transient
+# 429/5xx responses are retried with exponential backoff at the transport
+# layer so a single blip doesn't waste an entire scrape run.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["POST"],
+            respect_retry_after_header=True,
+        )
+    ),
+)
+
 # ============================================================================
 # SEARCH CONFIGURATION
 # ============================================================================
@@ -58,10 +114,19 @@ EVENTS_PER_PAGE = 100
 # Maximum number of events to fetch total
 MAX_EVENTS_TO_FETCH = 1000
 
+# Fetch full event details (multi-KB descriptions, photos) after pagination.
+# Listing fields alone are 5-10x smaller on the wire; enable this only when
+# the descriptions are actually consumed downstream.
+INCLUDE_EVENT_DETAILS = False
+
+# Number of aliased event(id:) lookups per detail-hydration request
+DETAIL_BATCH_SIZE = 50
+
 # ============================================================================
 
-# GraphQL query for searching events
-SEARCH_EVENTS_QUERY = """
+# Light GraphQL query used during pagination - omits description and photo
+# nodes, which dominate response size
+SEARCH_EVENTS_QUERY_LIST = """
 query($filter: EventSearchFilter!, $first: Int, $after: String) {
   eventSearch(filter: $filter, first: $first, after: $after) {
     pageInfo {
@@ -74,21 +139,12 @@ query($filter: EventSearchFilter!, $first: Int, $after: String) {
         id
         title
         eventUrl
-        description
         dateTime
         eventType
-        featuredEventPhoto {
-          id
-          baseUrl
-        }
         group {
           id
           name
           urlname
-          keyGroupPhoto {
-            id
-            baseUrl
-          }
         }
         venues {
           name
@@ -104,11 +160,149 @@ query($filter: EventSearchFilter!, $first: Int, $after: String) {
 }
 """
 
+# Heavy per-event fields fetched on demand by hydrate_event_details
+EVENT_DETAIL_FIELDS_FRAGMENT = """
+fragment EventDetailFields on Event {
+  id
+  description
+  featuredEventPhoto {
+    id
+    baseUrl
+  }
+  group {
+    id
+    keyGroupPhoto {
+      id
+      baseUrl
+    }
+  }
+}
+"""
+
+
+def build_event_details_query(count: int) -> str:
+    """
+    Build an aliased query fetching detail fields for `count` event ids.
+
+    Args:
+        count: Number of events in the batch
+
+    Returns:
+        GraphQL query string with one aliased event lookup per id
+    """
+    params = ", ".join(f"$id{i}: ID!" for i in range(count))
+    selections = "\n".join(
+        f"  e{i}: event(id: $id{i}) {{\n    ...EventDetailFields\n  }}"
+        for i in range(count)
+    )
+    return f"query({params}) {{\n{selections}\n}}\n" + EVENT_DETAIL_FIELDS_FRAGMENT
+
+
+def dump_json_to_stdout(result: Dict[str, Any]) -> None:
+    """
+    Pretty-print a result dict to stdout, using orjson when available.
+
+    Writing orjson's bytes straight to the stdout buffer avoids building the
+    indented output through the slower stdlib encoder.
+
+    Args:
+        result: JSON-serializable dict to print
+    """
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(result, indent=2))
+
+
+def dump_ndjson_to_stdout(metadata: Dict[str, Any], events: List[Dict[str, Any]]) -> None:
+    """
+    Stream metadata plus one event per line to stdout (NDJSON).
+
+    No indentation work, no giant intermediate string, and downstream
+    consumers can start processing before the dump finishes.
+
+    Args:
+        metadata: Run metadata, emitted as the first line
+        events: Event dicts, one per subsequent line
+    """
+    if orjson is not None:
+        write = sys.stdout.buffer.write
+        write(orjson.dumps(metadata))
+        write(b"\n")
+        for event in events:
+            write(orjson.dumps(event))
+            write(b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        write = sys.stdout.write
+        write(json.dumps(metadata) + "\n")
+        for event in events:
+            write(json.dumps(event) + "\n")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Fetch recent Meetup events sorted by date (newest to oldest)",
+    )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="emit one JSON object per line (metadata first, then events) instead of one indented document",
+    )
+    return parser.parse_args()
+
+
+@lru_cache(maxsize=None)
+def query_sha256(query: str) -> str:
+    """Return the sha256 hex digest of a GraphQL query string (memoized)."""
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+# Flipped to False once the server reports it doesn't implement Automatic
+# Persisted Queries; every request from then on carries the full query text
+# instead of erroring on the hash-only form again
+_APQ_SUPPORTED = True
+
+
+def is_persisted_query_not_found(data: Dict[str, Any]) -> bool:
+    """Check whether a response's errors mean the server doesn't know the query hash."""
+    for error in data.get("errors", []):
+        code = (error.get("extensions") or {}).get("code", "")
+        message = error.get("message", "")
+        if code == "PERSISTED_QUERY_NOT_FOUND" or "PersistedQueryNotFound" in message:
+            return True
+    return False
+
+
+def is_persisted_query_not_supported(data: Dict[str, Any]) -> bool:
+    """Check whether a response's errors mean the server doesn't implement APQ at all."""
+    for error in data.get("errors", []):
+        code = (error.get("extensions") or {}).get("code", "")
+        message = error.get("message", "")
+        if (
+            code == "PERSISTED_QUERY_NOT_SUPPORTED"
+            or "PersistedQueryNotSupported" in message
+            # Non-Apollo gateways reject the hash-only form with a plain
+            # missing-query error instead of an APQ error code
+            or "Must provide query string" in message
+        ):
+            return True
+    return False
+
 
 def run_graphql_query(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
     """
     Execute a GraphQL query against the Meetup API.
 
+    Uses Automatic Persisted Queries: only the sha256 of the query is sent,
+    with a one-time fallback to the full query text if the server doesn't
+    have it registered yet. This shrinks every subsequent request body and
+    skips server-side query parsing. Servers that don't implement APQ at
+    all get the full query text on every request instead.
+
     Args:
         query: GraphQL query string
         variables: Variables to pass to the query
@@ -119,6 +313,8 @@ def run_graphql_query(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
     Raises:
         SystemExit: If the API request fails
     """
+    global _APQ_SUPPORTED
+
     if not MEETUP_API_TOKEN:
         print("ERROR: MEETUP_API_TOKEN environment variable is not set", file=sys.stderr)
         sys.exit(1)
@@ -126,15 +322,27 @@ def run_graphql_query(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
     headers = {
         "Authorization": f"Bearer {MEETUP_API_TOKEN}",
         "Content-Type": "application/json",
+        # GraphQL JSON compresses heavily; advertise brotli alongside gzip,
+        # but only when the optional brotli package is installed - the
+        # client can't decode br bodies without it
+        "Accept-Encoding": "gzip, br" if brotli is not None else "gzip",
     }
 
-    payload = {
-        "query": query,
-        "variables": variables,
-    }
+    # Once the server has reported APQ unsupported, skip the hash form
+    # entirely and send the full query text from the start
+    payload: Dict[str, Any] = {"variables": variables}
+    if _APQ_SUPPORTED:
+        payload["extensions"] = {
+            "persistedQuery": {
+                "version": 1,
+                "sha256Hash": query_sha256(query),
+            },
+        }
+    else:
+        payload["query"] = query
 
     try:
-        response = requests.post(
+        response = _SESSION.post(
             MEETUP_API_ENDPOINT,
             headers=headers,
             json=payload,
@@ -148,7 +356,33 @@ def run_graphql_query(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
             )
             sys.exit(1)
 
-        data = response.json()
+        data = _loads(response.content)
+
+        # Server doesn't have this query hash yet (or doesn't do APQ at all)
+        # - retry once with the full text; in the unsupported case, keep
+        # sending the full text for the rest of the run
+        if "errors" in data and (
+            is_persisted_query_not_found(data) or is_persisted_query_not_supported(data)
+        ):
+            if is_persisted_query_not_supported(data):
+                _APQ_SUPPORTED = False
+                payload.pop("extensions", None)
+            payload["query"] = query
+            response = _SESSION.post(
+                MEETUP_API_ENDPOINT,
+                headers=headers,
+                json=payload,
+                timeout=30,
+            )
+
+            if response.status_code != 200:
+                print(
+                    f"ERROR: HTTP {response.status_code} - {response.text}",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+
+            data = _loads(response.content)
 
         # Check for GraphQL errors
         if "errors" in data:
@@ -161,11 +395,53 @@ def run_graphql_query(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
     except requests.exceptions.RequestException as e:
         print(f"ERROR: Request failed - {e}", file=sys.stderr)
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
+        # Covers both json.JSONDecodeError and orjson.JSONDecodeError
         print(f"ERROR: Failed to parse JSON response - {e}", file=sys.stderr)
         sys.exit(1)
 
 
+def hydrate_event_details(events: List[Dict[str, Any]]) -> None:
+    """
+    Fetch descriptions and photos for events retrieved via the light query.
+
+    Events are hydrated in place using batches of aliased event(id:) lookups,
+    so detail cost is only paid when INCLUDE_EVENT_DETAILS is enabled.
+
+    Args:
+        events: Event dicts from the list query (must contain "id")
+    """
+    events_by_id = {event["id"]: event for event in events if event.get("id")}
+    ids = list(events_by_id)
+
+    if not ids:
+        return
+
+    print(f"Hydrating details for {len(ids)} events in batches of {DETAIL_BATCH_SIZE}...", file=sys.stderr)
+
+    for start in range(0, len(ids), DETAIL_BATCH_SIZE):
+        batch = ids[start:start + DETAIL_BATCH_SIZE]
+        query = build_event_details_query(len(batch))
+        variables = {f"id{i}": event_id for i, event_id in enumerate(batch)}
+
+        result = run_graphql_query(query, variables)
+        data = result.get("data", {})
+
+        for i, event_id in enumerate(batch):
+            detail = data.get(f"e{i}")
+            if not detail:
+                continue
+
+            event = events_by_id[event_id]
+            event["description"] = detail.get("description")
+            event["featuredEventPhoto"] = detail.get("featuredEventPhoto")
+
+            group = event.get("group")
+            detail_group = detail.get("group") or {}
+            if group and detail_group:
+                group["keyGroupPhoto"] = detail_group.get("keyGroupPhoto")
+
+
 def fetch_recent_events() -> List[Dict[str, Any]]:
     """
     Fetch recent events with pagination.
@@ -173,7 +449,10 @@ def fetch_recent_events() -> List[Dict[str, Any]]:
     Returns:
         List of event dicts sorted by date (newest to oldest)
     """
-    all_events = []
+    # Preallocate to the known cap so the collection loop assigns into slots
+    # instead of triggering repeated list growth reallocations
+    all_events = [None] * MAX_EVENTS_TO_FETCH
+    event_count = 0
     page_count = 0
     after_cursor = None
 
@@ -183,71 +462,148 @@ def fetch_recent_events() -> List[Dict[str, Any]]:
 
     max_pages = (MAX_EVENTS_TO_FETCH + EVENTS_PER_PAGE - 1) // EVENTS_PER_PAGE
 
-    while page_count < max_pages and len(all_events) < MAX_EVENTS_TO_FETCH:
-        variables = {
+    def build_variables(cursor, first=EVENTS_PER_PAGE):
+        return {
             "filter": {
                 "query": SEARCH_QUERY,
                 "lat": SEARCH_LAT,
                 "lon": SEARCH_LON,
                 "radius": SEARCH_RADIUS_MILES,
             },
-            "first": EVENTS_PER_PAGE,
-            "after": after_cursor,
+            "first": first,
+            "after": cursor,
         }
 
-        print(f"Fetching page {page_count + 1}...", file=sys.stderr)
-
-        result = run_graphql_query(SEARCH_EVENTS_QUERY, variables)
-
-        # Extract events from this page
-        event_search = result.get("data", {}).get("eventSearch", {})
-        edges = event_search.get("edges", [])
+    has_next_page = False
+
+    # A single worker keeps at most one request in flight beyond the page
+    # currently being processed, so the next page downloads while this
+    # page's edges are collected
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        print(f"Fetching page 1...", file=sys.stderr)
+        pending = executor.submit(
+            run_graphql_query,
+            SEARCH_EVENTS_QUERY_LIST,
+            build_variables(None, min(EVENTS_PER_PAGE, MAX_EVENTS_TO_FETCH)),
+        )
 
-        # Add events to our collection
-        for edge in edges:
-            node = edge.get("node", {})
-            if node and node.get("id"):
-                all_events.append(node)
-                if len(all_events) >= MAX_EVENTS_TO_FETCH:
+        while page_count < max_pages and event_count < MAX_EVENTS_TO_FETCH:
+            if pending is None:
+                # The prefetch heuristic declined but we still need more
+                if not has_next_page or not after_cursor:
+                    print(f"\n✓ Reached end of results", file=sys.stderr)
                     break
-
-        page_count += 1
-        print(f"  Page {page_count}: fetched {len(edges)} events (total: {len(all_events)})", file=sys.stderr)
-
-        # Check if there are more pages
-        page_info = event_search.get("pageInfo", {})
-        has_next_page = page_info.get("hasNextPage", False)
-        after_cursor = page_info.get("endCursor")
-
-        if not has_next_page or not after_cursor:
-            print(f"\n✓ Reached end of results", file=sys.stderr)
-            break
+                # Only request as many events as are still needed
+                remaining = MAX_EVENTS_TO_FETCH - event_count
+                print(f"Fetching page {page_count + 1}...", file=sys.stderr)
+                pending = executor.submit(
+                    run_graphql_query,
+                    SEARCH_EVENTS_QUERY_LIST,
+                    build_variables(after_cursor, min(EVENTS_PER_PAGE, remaining)),
+                )
+
+            result = pending.result()
+            pending = None
+
+            event_search = result.get("data", {}).get("eventSearch", {})
+
+            # Read pagination state first so the next request can start
+            # before this page's edges are processed
+            page_info = event_search.get("pageInfo", {})
+            has_next_page = page_info.get("hasNextPage", False)
+            after_cursor = page_info.get("endCursor")
+
+            if (
+                has_next_page
+                and after_cursor
+                and page_count + 1 < max_pages
+                and event_count + EVENTS_PER_PAGE < MAX_EVENTS_TO_FETCH
+            ):
+                # Assume the in-flight page comes back full when sizing the next one
+                remaining = MAX_EVENTS_TO_FETCH - event_count - EVENTS_PER_PAGE
+                print(f"Fetching page {page_count + 2}...", file=sys.stderr)
+                pending = executor.submit(
+                    run_graphql_query,
+                    SEARCH_EVENTS_QUERY_LIST,
+                    build_variables(after_cursor, min(EVENTS_PER_PAGE, remaining)),
+                )
+
+            # Extract events from this page
+            edges = event_search.get("edges", [])
+
+            # Add events to our collection. Index directly instead of .get()
+            # with dict defaults - the schema guarantees the shape on success,
+            # and this skips two transient dict allocations per edge
+            for edge in edges:
+                try:
+                    node = edge["node"]
+                    if node["id"]:
+                        all_events[event_count] = node
+                        event_count += 1
+                        if event_count >= MAX_EVENTS_TO_FETCH:
+                            break
+                except (KeyError, TypeError):
+                    continue
+
+            page_count += 1
+            print(f"  Page {page_count}: fetched {len(edges)} events (total: {event_count})", file=sys.stderr)
+
+            # Break immediately once the cap is hit rather than looping again
+            if event_count >= MAX_EVENTS_TO_FETCH:
+                print(f"\n✓ Reached MAX_EVENTS_TO_FETCH limit ({MAX_EVENTS_TO_FETCH})", file=sys.stderr)
+                break
+
+            if pending is None and (not has_next_page or not after_cursor):
+                print(f"\n✓ Reached end of results", file=sys.stderr)
+                break
+
+    # Trim the unused preallocated tail in one step
+    del all_events[event_count:]
 
     print(f"\n✓ Fetched {len(all_events)} total events", file=sys.stderr)
 
     # Sort events by date (newest to oldest)
     print(f"Sorting events by date (newest to oldest)...", file=sys.stderr)
 
-    def get_event_datetime(event):
-        """Extract datetime from event for sorting."""
+    def get_event_timestamp_ns(event):
+        """Extract the event timestamp as Unix nanoseconds (0 if invalid)."""
         date_str = event.get("dateTime")
         if date_str:
             try:
-                return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                if ciso8601 is not None:
+                    return int(ciso8601.parse_datetime(date_str).timestamp() * 1e9)
+                return int(datetime.fromisoformat(date_str.replace("Z", "+00:00")).timestamp() * 1e9)
             except (ValueError, AttributeError):
                 pass
-        # Return a very old date for events without valid dates
-        return datetime(1970, 1, 1)
-
-    all_events.sort(key=get_event_datetime, reverse=True)
+        # Sort events without valid dates to the end
+        return 0
+
+    if np is not None:
+        # Parse each timestamp exactly once into an int64 array, then argsort
+        # in C instead of comparing datetime objects in Python
+        keys = np.fromiter(
+            (get_event_timestamp_ns(event) for event in all_events),
+            dtype=np.int64,
+            count=len(all_events),
+        )
+        order = np.argsort(keys, kind="stable")[::-1]
+        all_events = [all_events[i] for i in order]
+    else:
+        all_events.sort(key=get_event_timestamp_ns, reverse=True)
 
     return all_events
 
 
 def main() -> None:
     """Main entry point."""
+    args = parse_args()
+
     events = fetch_recent_events()
 
+    # Descriptions and photos are fetched lazily, only when configured
+    if INCLUDE_EVENT_DETAILS:
+        hydrate_event_details(events)
+
     result = {
         "search_config": {
             "lat": SEARCH_LAT,
@@ -260,8 +616,13 @@ def main() -> None:
         "events": events,
     }
 
-    # Pretty-print the JSON response
-    print(json.dumps(result, indent=2))
+    if args.ndjson:
+        # Stream one object per line: metadata first, then each event
+        metadata = {key: value for key, value in result.items() if key != "events"}
+        dump_ndjson_to_stdout(metadata, events)
+    else:
+        # Pretty-print the JSON response
+        dump_json_to_stdout(result)
 
     # Print summary to stderr
     print(f"\n{'='*80}", file=sys.stderr)
@@ -6,28 +6,58 @@ Reads university locations from staging_meetup.feed_source_university table
 and fetches events for each active university.
 
 Requirements:
-    pip install requests python-dotenv supabase
+    pip install aiohttp python-dotenv supabase
 
 Environment Variables:
     MEETUP_API_TOKEN - Your Meetup OAuth 2.0 access token
     MEETUP_API_ENDPOINT - GraphQL endpoint (default: https://api.meetup.com/gql-ext)
     SUPABASE_URL - Your Supabase project URL
     SUPABASE_SERVICE_ROLE_KEY - Your Supabase service role key
+    REDIS_URL - Optional Redis URL for caching GraphQL responses
+    GRAPHQL_CACHE_TTL_SECONDS - Cache TTL for GraphQL responses (default: 600)
 
 Usage:
     python fetch_university_events.py
 """
 
+import argparse
+import asyncio
+import hashlib
 import json
 import os
 import sys
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
-import requests
+import aiohttp
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+# Redis is optional - caching is simply disabled when it isn't installed
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# orjson serializes several times faster than stdlib json; fall back when
+# it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# brotli decoding is optional; br is only advertised when the package is
+# installed, since a server honoring it would otherwise send bodies the
+# client can't decode
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Fast path for decoding response bytes (orjson parses 2-5x faster than stdlib)
+_loads = orjson.loads if orjson is not None else json.loads
+
 # Meetup API uses MILES (not kilometers) with a silent cap at 100 miles
 MAX_RADIUS_MILES = 100
 
@@ -40,6 +70,29 @@ MEETUP_API_ENDPOINT = os.getenv("MEETUP_API_ENDPOINT", "https://api.meetup.com/g
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 
+# Optional Redis cache for GraphQL responses - identical (query, variables)
+# pairs return the cached JSON instead of re-hitting the Meetup API
+REDIS_URL = os.getenv("REDIS_URL")
+GRAPHQL_CACHE_TTL_SECONDS = int(os.getenv("GRAPHQL_CACHE_TTL_SECONDS", "600"))
+
+# Shared Redis client (connection pool is created once at first use)
+_REDIS_CLIENT = None
+
+# Shared Supabase client (created lazily on first use so its HTTP connection
+# pool is reused across queries and upserts)
+_SUPABASE_CLIENT: Optional[Client] = None
+
+# Meetup request headers are constant per process - build them once instead
+# of per request
+_MEETUP_HEADERS = {
+    "Authorization": f"Bearer {MEETUP_API_TOKEN}",
+    "Content-Type": "application/json",
+    # GraphQL JSON compresses heavily; advertise brotli alongside gzip, but
+    # only when the optional brotli package is installed - the client can't
+    # decode br bodies without it
+    "Accept-Encoding": "gzip, br" if brotli is not None else "gzip",
+}
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -59,8 +112,95 @@ MAX_PAGES_PER_UNIVERSITY = 10
 # Set to None to process all active universities
 UNIVERSITY_LIMIT = 5  # Change to a number like 5 for testing
 
+# Maximum number of concurrent in-flight requests to the Meetup API
+# (keeps us well under Meetup rate limits while overlapping network I/O)
+CONCURRENT_REQUESTS = 8
+
+# Number of universities whose first-page searches are combined into a single
+# aliased GraphQL request (pages after the first need each university's own
+# cursor, so only page 1 can be batched)
+UNIVERSITY_BATCH_SIZE = 10
+
+# Fetch full event details (multi-KB descriptions, photos) after pagination.
+# Listing fields alone are 5-10x smaller on the wire; enable this only when
+# the descriptions are actually consumed downstream.
+INCLUDE_EVENT_DETAILS = False
+
+# Number of aliased event(id:) lookups per detail-hydration request
+DETAIL_BATCH_SIZE = 50
+
+# Write fetched events to the staging_meetup.event table after deduplication
+PERSIST_TO_SUPABASE = False
+
+# Rows per Supabase upsert request - Postgres write throughput plateaus
+# around 1000-row batches
+PERSIST_BATCH_SIZE = 1000
+
 # ============================================================================
 
+# Shared fragment so the event selection set is written once and the batched
+# query document stays small. Descriptions and photos are omitted here and
+# fetched lazily by hydrate_event_details - they dominate response size.
+EVENT_FIELDS_FRAGMENT = """
+fragment EventFields on Event {
+  id
+  title
+  eventUrl
+  dateTime
+  eventType
+  group {
+    id
+    name
+    urlname
+  }
+  venues {
+    name
+    lat
+    lon
+    city
+    state
+    country
+  }
+}
+"""
+
+# Heavy per-event fields fetched on demand by hydrate_event_details
+EVENT_DETAIL_FIELDS_FRAGMENT = """
+fragment EventDetailFields on Event {
+  id
+  description
+  featuredEventPhoto {
+    id
+    baseUrl
+  }
+  group {
+    id
+    keyGroupPhoto {
+      id
+      baseUrl
+    }
+  }
+}
+"""
+
+
+def build_event_details_query(count: int) -> str:
+    """
+    Build an aliased query fetching detail fields for `count` event ids.
+
+    Args:
+        count: Number of events in the batch
+
+    Returns:
+        GraphQL query string with one aliased event lookup per id
+    """
+    params = ", ".join(f"$id{i}: ID!" for i in range(count))
+    selections = "\n".join(
+        f"  e{i}: event(id: $id{i}) {{\n    ...EventDetailFields\n  }}"
+        for i in range(count)
+    )
+    return f"query({params}) {{\n{selections}\n}}\n" + EVENT_DETAIL_FIELDS_FRAGMENT
+
 # GraphQL query for searching events
 SEARCH_EVENTS_QUERY = """
 query($filter: EventSearchFilter!, $first: Int, $after: String) {
@@ -72,43 +212,180 @@ query($filter: EventSearchFilter!, $first: Int, $after: String) {
     edges {
       cursor
       node {
-        id
-        title
-        eventUrl
-        description
-        dateTime
-        eventType
-        featuredEventPhoto {
-          id
-          baseUrl
-        }
-        group {
-          id
-          name
-          urlname
-          keyGroupPhoto {
-            id
-            baseUrl
-          }
-        }
-        venues {
-          name
-          lat
-          lon
-          city
-          state
-          country
-        }
+        ...EventFields
       }
     }
   }
 }
-"""
+""" + EVENT_FIELDS_FRAGMENT
+
+
+def build_first_page_batch_query(count: int) -> str:
+    """
+    Build an aliased query fetching the first page for `count` universities.
+
+    Each university's eventSearch becomes an aliased field (u0, u1, ...) so a
+    whole batch shares a single HTTP round-trip.
+
+    Args:
+        count: Number of universities in the batch
+
+    Returns:
+        GraphQL query string with one aliased eventSearch per university
+    """
+    params = ", ".join(f"$f{i}: EventSearchFilter!" for i in range(count))
+    selections = "\n".join(
+        f"""  u{i}: eventSearch(filter: $f{i}, first: $first) {{
+    pageInfo {{
+      hasNextPage
+      endCursor
+    }}
+    edges {{
+      cursor
+      node {{
+        ...EventFields
+      }}
+    }}
+  }}"""
+        for i in range(count)
+    )
+    return f"query($first: Int, {params}) {{\n{selections}\n}}\n" + EVENT_FIELDS_FRAGMENT
+
+
+def dump_json_to_stdout(result: Dict[str, Any]) -> None:
+    """
+    Pretty-print a result dict to stdout, using orjson when available.
+
+    Writing orjson's bytes straight to the stdout buffer avoids building the
+    indented output through the slower stdlib encoder.
+
+    Args:
+        result: JSON-serializable dict to print
+    """
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(result, indent=2))
+
+
+def dump_ndjson_to_stdout(metadata: Dict[str, Any], events: List[Dict[str, Any]]) -> None:
+    """
+    Stream metadata plus one event per line to stdout (NDJSON).
+
+    No indentation work, no giant intermediate string, and downstream
+    consumers can start processing before the dump finishes.
+
+    Args:
+        metadata: Run metadata, emitted as the first line
+        events: Event dicts, one per subsequent line
+    """
+    if orjson is not None:
+        write = sys.stdout.buffer.write
+        write(orjson.dumps(metadata))
+        write(b"\n")
+        for event in events:
+            write(orjson.dumps(event))
+            write(b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        write = sys.stdout.write
+        write(json.dumps(metadata) + "\n")
+        for event in events:
+            write(json.dumps(event) + "\n")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Fetch Meetup events for universities stored in Supabase",
+    )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="emit one JSON object per line (metadata first, then events) instead of one indented document",
+    )
+    return parser.parse_args()
+
+
+def get_response_cache():
+    """
+    Return the shared Redis client, or None if caching is unavailable.
+
+    Caching is enabled only when the redis package is installed and
+    REDIS_URL is set.
+    """
+    global _REDIS_CLIENT
+
+    if redis is None or not REDIS_URL:
+        return None
+
+    if _REDIS_CLIENT is None:
+        _REDIS_CLIENT = redis.Redis.from_url(REDIS_URL)
+
+    return _REDIS_CLIENT
+
+
+@lru_cache(maxsize=None)
+def query_sha256(query: str) -> str:
+    """Return the sha256 hex digest of a GraphQL query string (memoized)."""
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+# Flipped to False once the server reports it doesn't implement Automatic
+# Persisted Queries; every request from then on carries the full query text
+# instead of erroring on the hash-only form again
+_APQ_SUPPORTED = True
+
+
+def is_persisted_query_not_found(data: Dict[str, Any]) -> bool:
+    """Check whether a response's errors mean the server doesn't know the query hash."""
+    for error in data.get("errors", []):
+        code = (error.get("extensions") or {}).get("code", "")
+        message = error.get("message", "")
+        if code == "PERSISTED_QUERY_NOT_FOUND" or "PersistedQueryNotFound" in message:
+            return True
+    return False
+
+
+def is_persisted_query_not_supported(data: Dict[str, Any]) -> bool:
+    """Check whether a response's errors mean the server doesn't implement APQ at all."""
+    for error in data.get("errors", []):
+        code = (error.get("extensions") or {}).get("code", "")
+        message = error.get("message", "")
+        if (
+            code == "PERSISTED_QUERY_NOT_SUPPORTED"
+            or "PersistedQueryNotSupported" in message
+            # Non-Apollo gateways reject the hash-only form with a plain
+            # missing-query error instead of an APQ error code
+            or "Must provide query string" in message
+        ):
+            return True
+    return False
+
+
+def cache_key_for_query(query: str, variables: Dict[str, Any]) -> str:
+    """
+    Build a deterministic cache key for a (query, variables) pair.
+
+    Args:
+        query: GraphQL query string
+        variables: Variables to pass to the query
+
+    Returns:
+        Hex digest usable as a Redis key
+    """
+    canonical = query + json.dumps(variables, sort_keys=True)
+    return "meetup:gql:" + hashlib.sha256(canonical.encode()).hexdigest()
 
 
 def init_supabase() -> Client:
     """
-    Initialize Supabase client.
+    Initialize the shared Supabase client.
+
+    The client is created once and memoized, so repeated calls reuse the
+    same underlying HTTP session instead of re-running TLS setup.
 
     Returns:
         Supabase client instance
@@ -116,11 +393,16 @@ def init_supabase() -> Client:
     Raises:
         SystemExit: If credentials are missing
     """
-    if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
-        print("ERROR: SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set", file=sys.stderr)
-        sys.exit(1)
+    global _SUPABASE_CLIENT
+
+    if _SUPABASE_CLIENT is None:
+        if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
+            print("ERROR: SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set", file=sys.stderr)
+            sys.exit(1)
 
-    return create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
+        _SUPABASE_CLIENT = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
+
+    return _SUPABASE_CLIENT
 
 
 def fetch_active_universities(limit: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -180,11 +462,45 @@ def fetch_active_universities(limit: Optional[int] = None) -> List[Dict[str, Any
         sys.exit(1)
 
 
-def run_graphql_query(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+def persist_events(events: List[Dict[str, Any]]) -> None:
+    """
+    Upsert events into the staging_meetup.event table in bulk batches.
+
+    Batching collapses one round-trip per event into one per
+    PERSIST_BATCH_SIZE rows.
+
+    Args:
+        events: Deduplicated event dicts to upsert
+    """
+    if not events:
+        print("No events to persist.", file=sys.stderr)
+        return
+
+    supabase = init_supabase()
+
+    print(f"Persisting {len(events)} events to Supabase in batches of {PERSIST_BATCH_SIZE}...", file=sys.stderr)
+
+    for start in range(0, len(events), PERSIST_BATCH_SIZE):
+        batch = events[start:start + PERSIST_BATCH_SIZE]
+
+        try:
+            supabase.schema("staging_meetup").table("event") \
+                .upsert(batch, on_conflict="id").execute()
+            print(f"  ✓ Upserted events {start + 1}-{start + len(batch)}", file=sys.stderr)
+        except Exception as e:
+            print(f"  ✗ ERROR upserting batch starting at event {start + 1}: {e}", file=sys.stderr)
+
+
+async def run_graphql_query(
+    session: aiohttp.ClientSession,
+    query: str,
+    variables: Dict[str, Any],
+) -> Dict[str, Any]:
     """
     Execute a GraphQL query against the Meetup API.
 
     Args:
+        session: Shared aiohttp client session (reuses TCP/TLS connections)
         query: GraphQL query string
         variables: Variables to pass to the query
 
@@ -192,61 +508,151 @@ def run_graphql_query(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
         JSON response as a dict
 
     Raises:
-        SystemExit: If the API request fails
+        Exception: If the API request fails; raised (not sys.exit) so one
+            failing request doesn't take down the concurrently running others
     """
+    global _APQ_SUPPORTED
+
     if not MEETUP_API_TOKEN:
         print("ERROR: MEETUP_API_TOKEN environment variable is not set", file=sys.stderr)
         sys.exit(1)
 
-    headers = {
-        "Authorization": f"Bearer {MEETUP_API_TOKEN}",
-        "Content-Type": "application/json",
-    }
-
-    payload = {
-        "query": query,
-        "variables": variables,
-    }
+    # Automatic Persisted Queries: send only the query hash, falling back to
+    # the full query text the first time the server reports it unknown. Once
+    # the server has reported APQ unsupported, skip the hash form entirely
+    payload: Dict[str, Any] = {"variables": variables}
+    if _APQ_SUPPORTED:
+        payload["extensions"] = {
+            "persistedQuery": {
+                "version": 1,
+                "sha256Hash": query_sha256(query),
+            },
+        }
+    else:
+        payload["query"] = query
+
+    # Return a cached response if an identical query was made recently.
+    # The redis client is synchronous, so its network round-trips run in a
+    # worker thread - executed inline they would stall every concurrent
+    # university fetch sharing the event loop
+    cache = get_response_cache()
+    cache_key = None
+    if cache is not None:
+        cache_key = cache_key_for_query(query, variables)
+        try:
+            cached = await asyncio.to_thread(cache.get, cache_key)
+        except redis.RedisError as e:
+            print(f"WARNING: Redis cache read failed - {e}", file=sys.stderr)
+            cached = None
+        if cached:
+            return json.loads(cached)
 
     try:
-        response = requests.post(
+        async with session.post(
             MEETUP_API_ENDPOINT,
-            headers=headers,
+            headers=_MEETUP_HEADERS,
             json=payload,
-            timeout=30,
-        )
-
-        if response.status_code != 200:
-            print(
-                f"ERROR: HTTP {response.status_code} - {response.text}",
-                file=sys.stderr,
-            )
-            sys.exit(1)
-
-        data = response.json()
+        ) as response:
+            if response.status != 200:
+                body = await response.text()
+                raise Exception(f"HTTP {response.status} - {body}")
+
+            data = _loads(await response.read())
+
+        # Server doesn't have this query hash yet (or doesn't do APQ at all)
+        # - retry once with the full text; in the unsupported case, keep
+        # sending the full text for the rest of the run
+        if "errors" in data and (
+            is_persisted_query_not_found(data) or is_persisted_query_not_supported(data)
+        ):
+            if is_persisted_query_not_supported(data):
+                _APQ_SUPPORTED = False
+                payload.pop("extensions", None)
+            payload["query"] = query
+            async with session.post(
+                MEETUP_API_ENDPOINT,
+                headers=_MEETUP_HEADERS,
+                json=payload,
+            ) as response:
+                if response.status != 200:
+                    body = await response.text()
+                    raise Exception(f"HTTP {response.status} - {body}")
+
+                data = _loads(await response.read())
 
         # Check for GraphQL errors
         if "errors" in data:
-            print("ERROR: GraphQL errors occurred:", file=sys.stderr)
-            print(json.dumps(data["errors"], indent=2), file=sys.stderr)
-            sys.exit(1)
+            raise Exception(f"GraphQL errors: {json.dumps(data['errors'])}")
+
+        if cache is not None and cache_key:
+            try:
+                await asyncio.to_thread(
+                    cache.setex, cache_key, GRAPHQL_CACHE_TTL_SECONDS, json.dumps(data)
+                )
+            except redis.RedisError as e:
+                print(f"WARNING: Redis cache write failed - {e}", file=sys.stderr)
 
         return data
 
-    except requests.exceptions.RequestException as e:
-        print(f"ERROR: Request failed - {e}", file=sys.stderr)
-        sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"ERROR: Failed to parse JSON response - {e}", file=sys.stderr)
-        sys.exit(1)
+    except aiohttp.ClientError as e:
+        raise Exception(f"Request failed - {e}")
+    except ValueError as e:
+        # Covers both json.JSONDecodeError and orjson.JSONDecodeError
+        raise Exception(f"Failed to parse JSON response - {e}")
+
+
+async def fetch_first_pages(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    universities: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Fetch the first page of results for a batch of universities in one request.
+
+    Args:
+        session: Shared aiohttp client session
+        semaphore: Semaphore capping concurrent in-flight requests
+        universities: Batch of university dicts with name, latitude, longitude
+
+    Returns:
+        List of eventSearch payloads, one per university, in input order
+    """
+    radius_miles = min(SEARCH_RADIUS_MILES, MAX_RADIUS_MILES)
+
+    query = build_first_page_batch_query(len(universities))
+    variables: Dict[str, Any] = {"first": EVENTS_PER_PAGE}
+    for i, university in enumerate(universities):
+        variables[f"f{i}"] = {
+            "query": SEARCH_QUERY,
+            "lat": university["latitude"],
+            "lon": university["longitude"],
+            "radius": radius_miles,
+        }
+
+    print(f"Fetching first pages for {len(universities)} universities in one request...", file=sys.stderr)
+
+    async with semaphore:
+        result = await run_graphql_query(session, query, variables)
+
+    data = result.get("data", {})
+    return [data.get(f"u{i}", {}) for i in range(len(universities))]
 
 
-def fetch_events_for_university(university: Dict[str, Any]) -> List[Dict[str, Any]]:
+async def fetch_events_for_university(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    university: Dict[str, Any],
+    first_page: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
     """
     Fetch all events near a university with pagination.
 
     Args:
+        session: Shared aiohttp client session
+        semaphore: Semaphore capping concurrent in-flight requests
         university: Dict with name, latitude, longitude
+        first_page: Optional eventSearch payload for page 1, already fetched
+            as part of a batched request
 
     Returns:
         List of event dicts
@@ -261,7 +667,10 @@ def fetch_events_for_university(university: Dict[str, Any]) -> List[Dict[str, An
     if SEARCH_RADIUS_MILES > MAX_RADIUS_MILES:
         print(f"WARNING: Radius {SEARCH_RADIUS_MILES} miles exceeds maximum of {MAX_RADIUS_MILES} miles. Capping at {MAX_RADIUS_MILES} miles.", file=sys.stderr)
 
-    all_events = []
+    # Preallocate to the per-university cap so the collection loop assigns
+    # into slots instead of triggering repeated list growth reallocations
+    all_events = [None] * (MAX_PAGES_PER_UNIVERSITY * EVENTS_PER_PAGE)
+    event_count = 0
     page_count = 0
     after_cursor = None
 
@@ -270,41 +679,52 @@ def fetch_events_for_university(university: Dict[str, Any]) -> List[Dict[str, An
     print(f"  Radius: {radius_miles} miles", file=sys.stderr)
 
     while page_count < MAX_PAGES_PER_UNIVERSITY:
-        variables = {
-            "filter": {
-                "query": SEARCH_QUERY,
-                "lat": lat,
-                "lon": lon,
-                "radius": radius_miles,
-            },
-            "first": EVENTS_PER_PAGE,
-            "after": after_cursor,
-        }
+        if page_count == 0 and first_page is not None:
+            # Page 1 already arrived as part of a batched aliased request
+            event_search = first_page
+        else:
+            variables = {
+                "filter": {
+                    "query": SEARCH_QUERY,
+                    "lat": lat,
+                    "lon": lon,
+                    "radius": radius_miles,
+                },
+                "first": EVENTS_PER_PAGE,
+                "after": after_cursor,
+            }
 
-        print(f"  Fetching page {page_count + 1}...", file=sys.stderr)
+            print(f"  Fetching page {page_count + 1}...", file=sys.stderr)
 
-        result = run_graphql_query(SEARCH_EVENTS_QUERY, variables)
+            async with semaphore:
+                result = await run_graphql_query(session, SEARCH_EVENTS_QUERY, variables)
+
+            event_search = result.get("data", {}).get("eventSearch", {})
 
         # Extract events from this page
-        event_search = result.get("data", {}).get("eventSearch", {})
         edges = event_search.get("edges", [])
 
-        # Add events to our collection
+        # Add events to our collection. Index directly instead of .get() with
+        # dict defaults - the schema guarantees the shape on success, and this
+        # skips two transient dict allocations per edge
         for edge in edges:
-            node = edge.get("node", {})
-            if node and node.get("id"):
-                # Add university context to each event
-                event_with_context = {
-                    "university_name": name,
-                    "university_lat": lat,
-                    "university_lon": lon,
-                    "search_radius_miles": radius_miles,
-                    **node
-                }
-                all_events.append(event_with_context)
+            try:
+                node = edge["node"]
+                if not node["id"]:
+                    continue
+            except (KeyError, TypeError):
+                continue
+            # Add university context in place - the node dict is owned
+            # exclusively here, so mutating it avoids a full copy per event
+            node["university_name"] = name
+            node["university_lat"] = lat
+            node["university_lon"] = lon
+            node["search_radius_miles"] = radius_miles
+            all_events[event_count] = node
+            event_count += 1
 
         page_count += 1
-        print(f"  Page {page_count}: fetched {len(edges)} events (total for this university: {len(all_events)})", file=sys.stderr)
+        print(f"  Page {page_count}: fetched {len(edges)} events (total for this university: {event_count})", file=sys.stderr)
 
         # Check if there are more pages
         page_info = event_search.get("pageInfo", {})
@@ -318,13 +738,71 @@ def fetch_events_for_university(university: Dict[str, Any]) -> List[Dict[str, An
     if page_count >= MAX_PAGES_PER_UNIVERSITY:
         print(f"  ⚠ Reached maximum page limit ({MAX_PAGES_PER_UNIVERSITY}) for {name}. There may be more events available.", file=sys.stderr)
 
+    # Trim the unused preallocated tail in one step
+    del all_events[event_count:]
+
     print(f"  ✓ Total events found for {name}: {len(all_events)}", file=sys.stderr)
 
     return all_events
 
 
-def main() -> None:
+async def hydrate_event_details(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    events: List[Dict[str, Any]],
+) -> None:
+    """
+    Fetch descriptions and photos for events retrieved via the light query.
+
+    Events are hydrated in place using batches of aliased event(id:) lookups,
+    so detail cost is only paid when INCLUDE_EVENT_DETAILS is enabled. Called
+    after deduplication so each event is hydrated at most once.
+
+    Args:
+        session: Shared aiohttp client session
+        semaphore: Semaphore capping concurrent in-flight requests
+        events: Event dicts from the list query (must contain "id")
+    """
+    events_by_id = {event["id"]: event for event in events if event.get("id")}
+    ids = list(events_by_id)
+
+    if not ids:
+        return
+
+    print(f"Hydrating details for {len(ids)} events in batches of {DETAIL_BATCH_SIZE}...", file=sys.stderr)
+
+    async def hydrate_batch(batch: List[str]) -> None:
+        query = build_event_details_query(len(batch))
+        variables = {f"id{i}": event_id for i, event_id in enumerate(batch)}
+
+        async with semaphore:
+            result = await run_graphql_query(session, query, variables)
+
+        data = result.get("data", {})
+        for i, event_id in enumerate(batch):
+            detail = data.get(f"e{i}")
+            if not detail:
+                continue
+
+            event = events_by_id[event_id]
+            event["description"] = detail.get("description")
+            event["featuredEventPhoto"] = detail.get("featuredEventPhoto")
+
+            group = event.get("group")
+            detail_group = detail.get("group") or {}
+            if group and detail_group:
+                group["keyGroupPhoto"] = detail_group.get("keyGroupPhoto")
+
+    await asyncio.gather(*(
+        hydrate_batch(ids[start:start + DETAIL_BATCH_SIZE])
+        for start in range(0, len(ids), DETAIL_BATCH_SIZE)
+    ))
+
+
+async def main() -> None:
     """Main entry point."""
+    args = parse_args()
+
     print(f"{'='*80}", file=sys.stderr)
     print(f"UNIVERSITY EVENTS FETCHER", file=sys.stderr)
     print(f"{'='*80}", file=sys.stderr)
@@ -334,6 +812,7 @@ def main() -> None:
     print(f"  Events per page: {EVENTS_PER_PAGE}", file=sys.stderr)
     print(f"  Max pages per university: {MAX_PAGES_PER_UNIVERSITY}", file=sys.stderr)
     print(f"  University limit: {UNIVERSITY_LIMIT if UNIVERSITY_LIMIT else 'All'}", file=sys.stderr)
+    print(f"  Concurrent requests: {CONCURRENT_REQUESTS}", file=sys.stderr)
     print(f"{'='*80}\n", file=sys.stderr)
 
     # Fetch active universities from Supabase
@@ -343,23 +822,75 @@ def main() -> None:
         print("\n⚠ No valid universities to process. Exiting.", file=sys.stderr)
         sys.exit(0)
 
-    all_events = []
     successful_universities = 0
     failed_universities = 0
 
-    # Fetch events for each university
-    for i, university in enumerate(universities, 1):
-        print(f"\n{'='*80}", file=sys.stderr)
-        print(f"Processing University {i}/{len(universities)}: {university['name']}", file=sys.stderr)
-        print(f"{'='*80}", file=sys.stderr)
+    # Fetch events for all universities concurrently, sharing one session so
+    # TCP connections and TLS sessions are reused across requests
+    semaphore = asyncio.Semaphore(CONCURRENT_REQUESTS)
+    timeout = aiohttp.ClientTimeout(total=30)
+
+    results = []
+
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        # Batch the first pages so each chunk of universities costs one
+        # request, then paginate the remainder per university concurrently
+        for start in range(0, len(universities), UNIVERSITY_BATCH_SIZE):
+            batch = universities[start:start + UNIVERSITY_BATCH_SIZE]
+
+            try:
+                first_pages = await fetch_first_pages(session, semaphore, batch)
+            except Exception as e:
+                print(f"WARNING: Batched first-page fetch failed ({e}); falling back to per-university queries", file=sys.stderr)
+                first_pages = [None] * len(batch)
+
+            # return_exceptions keeps one university's failure from aborting
+            # the rest; errors surface as entries and are reported below
+            results.extend(await asyncio.gather(
+                *(fetch_events_for_university(session, semaphore, university, first_page)
+                  for university, first_page in zip(batch, first_pages)),
+                return_exceptions=True,
+            ))
+
+        # Deduplicate across universities - overlapping search radii return
+        # the same event several times, so keep one copy per id and record
+        # every university that matched it
+        events_by_id: Dict[str, Dict[str, Any]] = {}
+        total_fetched = 0
+
+        for university, result in zip(universities, results):
+            if isinstance(result, Exception):
+                print(f"✗ ERROR processing {university['name']}: {result}", file=sys.stderr)
+                failed_universities += 1
+                continue
 
-        try:
-            events = fetch_events_for_university(university)
-            all_events.extend(events)
             successful_universities += 1
-        except Exception as e:
-            print(f"✗ ERROR processing {university['name']}: {e}", file=sys.stderr)
-            failed_universities += 1
+            total_fetched += len(result)
+
+            for event in result:
+                event_id = event.get("id")
+                if not event_id:
+                    continue
+
+                existing = events_by_id.get(event_id)
+                if existing is None:
+                    event["matched_universities"] = [event.pop("university_name")]
+                    events_by_id[event_id] = event
+                else:
+                    existing["matched_universities"].append(event["university_name"])
+
+        all_events = list(events_by_id.values())
+
+        print(f"\nDeduplication: {total_fetched} events fetched, {len(all_events)} unique ({total_fetched - len(all_events)} duplicates merged)", file=sys.stderr)
+
+        # Descriptions and photos are fetched lazily, only when configured,
+        # and only for deduplicated events
+        if INCLUDE_EVENT_DETAILS:
+            await hydrate_event_details(session, semaphore, all_events)
+
+    # Optionally persist the deduplicated events in bulk batches
+    if PERSIST_TO_SUPABASE:
+        persist_events(all_events)
 
     # Prepare result
     result = {
@@ -368,9 +899,10 @@ def main() -> None:
             "successful_universities": successful_universities,
             "failed_universities": failed_universities,
             "total_events": len(all_events),
+            "duplicates_merged": total_fetched - len(all_events),
             "search_radius_miles": SEARCH_RADIUS_MILES,
             "search_query": SEARCH_QUERY,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
         },
         "universities": [
             {
@@ -383,8 +915,13 @@ def main() -> None:
         "events": all_events,
     }
 
-    # Pretty-print the JSON response to stdout
-    print(json.dumps(result, indent=2))
+    if args.ndjson:
+        # Stream one object per line: metadata first, then each event
+        metadata = {key: value for key, value in result.items() if key != "events"}
+        dump_ndjson_to_stdout(metadata, all_events)
+    else:
+        # Pretty-print the JSON response to stdout
+        dump_json_to_stdout(result)
 
     # Print summary to stderr
     print(f"\n{'='*80}", file=sys.stderr)
@@ -396,12 +933,13 @@ def main() -> None:
     print(f"Total events fetched: {len(all_events)}", file=sys.stderr)
 
     if all_events:
-        # Show breakdown by university
+        # Show breakdown by university (deduplicated events count once per
+        # university that matched them)
         print(f"\nEvents by university:", file=sys.stderr)
         university_counts = {}
         for event in all_events:
-            uni_name = event.get("university_name", "Unknown")
-            university_counts[uni_name] = university_counts.get(uni_name, 0) + 1
+            for uni_name in event.get("matched_universities", ["Unknown"]):
+                university_counts[uni_name] = university_counts.get(uni_name, 0) + 1
 
         for uni_name, count in sorted(university_counts.items(), key=lambda x: x[1], reverse=True):
             print(f"  {uni_name}: {count} events", file=sys.stderr)
@@ -410,4 +948,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -18,14 +18,29 @@ Usage:
     python location_all_events.py
 """
 
+import argparse
 import json
 import os
 import sys
-from typing import Dict, Any
+from typing import Any, Dict, List, Tuple
 
 import requests
 from dotenv import load_dotenv
 
+# orjson serializes several times faster than stdlib json; fall back when
+# it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson parses the response incrementally, building only the paths we use
+# instead of materializing the full tree; fall back when it isn't installed
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Meetup API uses MILES (not kilometers) with a silent cap at 100 miles
 MAX_RADIUS_MILES = 100
 
@@ -166,6 +181,126 @@ def run_graphql_query(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
         sys.exit(1)
 
 
+def _parse_event_page_stream(raw) -> Tuple[List[Dict[str, Any]], Dict[str, Any], Any]:
+    """
+    Single-pass streaming parse of one eventSearch response.
+
+    Builds only the edge nodes, the pageInfo block and any errors array;
+    the rest of the response tree is never materialized, which roughly
+    halves peak memory per page of heavy description text.
+
+    Args:
+        raw: File-like object yielding the response body
+
+    Returns:
+        Tuple of (event nodes, pageInfo dict, errors or None)
+    """
+    nodes: List[Dict[str, Any]] = []
+    page_info: Dict[str, Any] = {}
+    errors = None
+
+    builder = None
+    builder_prefix = None
+    builder_sink = None
+
+    for prefix, event, value in ijson.parse(raw):
+        if builder is None:
+            if (prefix, event) == ("data.eventSearch.edges.item.node", "start_map"):
+                builder_sink = "node"
+            elif (prefix, event) == ("data.eventSearch.pageInfo", "start_map"):
+                builder_sink = "page_info"
+            elif (prefix, event) == ("errors", "start_array"):
+                builder_sink = "errors"
+            else:
+                continue
+            builder = ijson.ObjectBuilder()
+            builder_prefix = prefix
+
+        builder.event(event, value)
+
+        # Container start/end events share the same prefix, so this fires
+        # exactly when the subtree we are building closes
+        if event in ("end_map", "end_array") and prefix == builder_prefix:
+            if builder_sink == "node":
+                nodes.append(builder.value)
+            elif builder_sink == "page_info":
+                page_info = builder.value
+            else:
+                errors = builder.value
+            builder = None
+
+    return nodes, page_info, errors
+
+
+def fetch_events_page(variables: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Fetch one eventSearch page, streaming the parse when ijson is available.
+
+    Args:
+        variables: Variables to pass to SEARCH_EVENTS_QUERY
+
+    Returns:
+        Tuple of (event nodes, pageInfo dict)
+
+    Raises:
+        SystemExit: If the API request fails
+    """
+    if ijson is None:
+        result = run_graphql_query(SEARCH_EVENTS_QUERY, variables)
+        event_search = result.get("data", {}).get("eventSearch", {})
+        edges = event_search.get("edges", [])
+        return [edge.get("node", {}) for edge in edges], event_search.get("pageInfo", {})
+
+    if not MEETUP_API_TOKEN:
+        print("ERROR: MEETUP_API_TOKEN environment variable is not set", file=sys.stderr)
+        sys.exit(1)
+
+    headers = {
+        "Authorization": f"Bearer {MEETUP_API_TOKEN}",
+        "Content-Type": "application/json",
+    }
+
+    payload = {
+        "query": SEARCH_EVENTS_QUERY,
+        "variables": variables,
+    }
+
+    try:
+        response = requests.post(
+            MEETUP_API_ENDPOINT,
+            headers=headers,
+            json=payload,
+            timeout=30,
+            stream=True,
+        )
+
+        if response.status_code != 200:
+            print(
+                f"ERROR: HTTP {response.status_code} - {response.text}",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
+        # Let urllib3 decompress as we read so ijson sees plain JSON bytes
+        response.raw.decode_content = True
+        nodes, page_info, errors = _parse_event_page_stream(response.raw)
+
+    except requests.exceptions.RequestException as e:
+        print(f"ERROR: Request failed - {e}", file=sys.stderr)
+        sys.exit(1)
+    except ijson.JSONError as e:
+        print(f"ERROR: Failed to parse JSON response - {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # Check for GraphQL errors
+    if errors:
+        print("ERROR: GraphQL errors occurred:", file=sys.stderr)
+        print(json.dumps(errors, indent=2), file=sys.stderr)
+        sys.exit(1)
+
+    return nodes, page_info
+
+
 def get_all_location_events() -> Dict[str, Any]:
     """
     Fetch all events near the configured location with pagination.
@@ -202,23 +337,15 @@ def get_all_location_events() -> Dict[str, Any]:
 
         print(f"Fetching page {page_count + 1}...", file=sys.stderr)
 
-        result = run_graphql_query(SEARCH_EVENTS_QUERY, variables)
-
-        # Extract events from this page
-        event_search = result.get("data", {}).get("eventSearch", {})
-        edges = event_search.get("edges", [])
+        nodes, page_info = fetch_events_page(variables)
 
-        # Add events to our collection
-        for edge in edges:
-            node = edge.get("node", {})
-            if node and node.get("id"):
-                all_events.append(node)
+        # Add events to our collection (single pass, no per-node method lookups)
+        all_events.extend(node for node in nodes if node and node.get("id"))
 
         page_count += 1
-        print(f"  Page {page_count}: fetched {len(edges)} events (total so far: {len(all_events)})", file=sys.stderr)
+        print(f"  Page {page_count}: fetched {len(nodes)} events (total so far: {len(all_events)})", file=sys.stderr)
 
         # Check if there are more pages
-        page_info = event_search.get("pageInfo", {})
         has_next_page = page_info.get("hasNextPage", False)
         after_cursor = page_info.get("endCursor")
 
@@ -243,12 +370,65 @@ def get_all_location_events() -> Dict[str, Any]:
     }
 
 
+def dump_ndjson_to_stdout(result: Dict[str, Any]) -> None:
+    """
+    Stream the run metadata plus one event per line to stdout (NDJSON).
+
+    No indentation work, no giant intermediate string, and downstream
+    consumers (jq, ingest jobs) can start processing before the dump
+    finishes.
+
+    Args:
+        result: Result dict from get_all_location_events
+    """
+    events = result.get("events", [])
+    metadata = {k: v for k, v in result.items() if k != "events"}
+
+    if orjson is not None:
+        write = sys.stdout.buffer.write
+        write(orjson.dumps(metadata))
+        write(b"\n")
+        for event in events:
+            write(orjson.dumps(event))
+            write(b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        write = sys.stdout.write
+        write(json.dumps(metadata) + "\n")
+        for event in events:
+            write(json.dumps(event) + "\n")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Fetch all Meetup events near the configured location.",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="pretty-print one indented JSON document instead of NDJSON "
+             "(slower for large result sets)",
+    )
+    return parser.parse_args()
+
+
 def main() -> None:
     """Main entry point."""
+    args = parse_args()
+
     result = get_all_location_events()
 
-    # Pretty-print the JSON response
-    print(json.dumps(result, indent=2))
+    if args.json:
+        # Pretty-print the JSON response
+        if orjson is not None:
+            sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+            sys.stdout.buffer.write(b"\n")
+            sys.stdout.buffer.flush()
+        else:
+            print(json.dumps(result, indent=2))
+    else:
+        dump_ndjson_to_stdout(result)
 
     # Print summary to stderr
     print(f"\n{'='*80}", file=sys.stderr)
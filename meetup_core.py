@@ -0,0 +1,284 @@
+"""
+meetup_core.py
+
+Shared Meetup GraphQL client core for the test drivers.
+
+Collects the pieces each test script was carrying its own copy of:
+environment/config loading, the constant request headers, the optional
+Redis response cache and the async query/batch execution paths. Variant
+scripts only supply their own GraphQL query string and filter builder.
+
+Requirements:
+    pip install httpx[http2] python-dotenv
+
+Environment Variables:
+    MEETUP_API_TOKEN - Your Meetup OAuth 2.0 access token
+    MEETUP_API_ENDPOINT - GraphQL endpoint (default: https://api.meetup.com/gql-ext)
+    REDIS_URL - Optional Redis URL; enables caching of GraphQL responses
+        across runs (requires the redis package)
+    GRAPHQL_CACHE_TTL_SECONDS - Cache TTL for GraphQL responses (default: 1800)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sys
+from typing import Dict, Any, List
+
+import httpx
+from dotenv import load_dotenv
+
+# orjson parses and serializes several times faster than stdlib json; fall
+# back when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# redis enables caching of GraphQL responses across runs (CI, local
+# iteration); the scripts work without it
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# brotli decoding is optional; br is only advertised when the package is
+# installed, since a server honoring it would otherwise send bodies the
+# client can't decode
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Fast path for decoding response bytes (orjson parses 2-5x faster than stdlib)
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Meetup API uses MILES (not kilometers) with a silent cap at 100 miles
+MAX_RADIUS_MILES = 100
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Configuration
+MEETUP_API_TOKEN = os.getenv("MEETUP_API_TOKEN")
+MEETUP_API_ENDPOINT = os.getenv("MEETUP_API_ENDPOINT", "https://api.meetup.com/gql-ext")
+
+# Request headers are constant per process - build them once instead of
+# re-interpolating the bearer token and re-allocating the dict per call
+MEETUP_HEADERS = {
+    "Authorization": f"Bearer {MEETUP_API_TOKEN}",
+    "Content-Type": "application/json",
+    # GraphQL JSON compresses heavily; advertise brotli alongside gzip, but
+    # only when the optional brotli package is installed - the client can't
+    # decode br bodies without it
+    "Accept-Encoding": "br, gzip" if brotli is not None else "gzip",
+}
+
+# Repeat runs send identical queries; cached responses skip the network
+# round trip entirely (and the API rate-limit cost with it)
+REDIS_URL = os.getenv("REDIS_URL")
+GRAPHQL_CACHE_TTL_SECONDS = int(os.getenv("GRAPHQL_CACHE_TTL_SECONDS", "1800"))
+
+_REDIS_CLIENT = None
+
+
+def get_response_cache():
+    """
+    Return the shared Redis client, or None if caching is unavailable.
+
+    Caching is enabled only when the redis package is installed and
+    REDIS_URL is set.
+    """
+    global _REDIS_CLIENT
+
+    if redis is None or not REDIS_URL:
+        return None
+
+    if _REDIS_CLIENT is None:
+        _REDIS_CLIENT = redis.Redis.from_url(REDIS_URL)
+
+    return _REDIS_CLIENT
+
+
+def cache_key_for_query(query: str, variables: Dict[str, Any]) -> str:
+    """
+    Build a deterministic cache key for a (query, variables) pair.
+
+    Args:
+        query: GraphQL query string
+        variables: Variables to pass to the query
+
+    Returns:
+        Hex digest usable as a Redis key
+    """
+    canonical = query + json.dumps(variables, sort_keys=True)
+    return "meetup:gql:" + hashlib.sha256(canonical.encode()).hexdigest()
+
+
+async def run_graphql_query(
+    client: httpx.AsyncClient,
+    query: str,
+    variables: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Execute a GraphQL query against the Meetup API.
+
+    Args:
+        client: Shared httpx async client (reuses the TCP/TLS connection)
+        query: GraphQL query string
+        variables: Variables to pass to the query
+
+    Returns:
+        JSON response as a dict
+
+    Raises:
+        Exception: If the API request fails; raised (not sys.exit) so one
+            failing query doesn't take down the concurrently running others
+    """
+    payload = {
+        "query": query,
+        "variables": variables,
+    }
+
+    # Return a cached response if an identical query ran recently. The redis
+    # client is synchronous, so its round-trips run in a worker thread -
+    # executed inline they would stall the other queries on the event loop
+    cache = get_response_cache()
+    cache_key = None
+    if cache is not None:
+        cache_key = cache_key_for_query(query, variables)
+        try:
+            cached = await asyncio.to_thread(cache.get, cache_key)
+        except redis.RedisError as e:
+            print(f"WARNING: Redis cache read failed - {e}", file=sys.stderr)
+            cached = None
+        if cached:
+            return _loads(cached)
+
+    try:
+        response = await client.post(MEETUP_API_ENDPOINT, json=payload)
+
+        if response.status_code != 200:
+            # Known-UTF-8 API; decode directly instead of running charset
+            # detection on the error body
+            body = response.content.decode("utf-8", errors="replace")
+            raise Exception(f"HTTP {response.status_code} - {body}")
+
+        # Parse the raw bytes directly - skips the content-type checks and
+        # stdlib's str decode
+        data = _loads(response.content)
+
+        # Check for GraphQL errors
+        if "errors" in data:
+            raise Exception(f"GraphQL errors: {json.dumps(data['errors'])}")
+
+        # Only successful responses are cached - errors shouldn't evict or
+        # mask good entries
+        if cache is not None and cache_key:
+            try:
+                await asyncio.to_thread(
+                    cache.setex, cache_key, GRAPHQL_CACHE_TTL_SECONDS, json.dumps(data)
+                )
+            except redis.RedisError as e:
+                print(f"WARNING: Redis cache write failed - {e}", file=sys.stderr)
+
+        return data
+
+    except httpx.HTTPError as e:
+        raise Exception(f"Request failed - {e}")
+    except ValueError as e:
+        # Covers both json.JSONDecodeError and orjson.JSONDecodeError
+        raise Exception(f"Failed to parse JSON response - {e}")
+
+
+async def run_graphql_batch(
+    client: httpx.AsyncClient,
+    operations: List[tuple],
+) -> List[Any]:
+    """
+    Execute several GraphQL operations in one HTTP request.
+
+    The endpoint accepts an array of operations per POST, so N test queries
+    share one round trip instead of paying N of them.
+
+    Args:
+        client: Shared httpx async client
+        operations: List of (query, variables) tuples
+
+    Returns:
+        List aligned with operations; each entry is the response dict, or an
+        Exception when that operation reported GraphQL errors
+
+    Raises:
+        Exception: If the request fails or the response is not a batch array
+    """
+    results: List[Any] = [None] * len(operations)
+
+    # Serve cached entries and only put the misses on the wire; reads go
+    # through a worker thread like the per-query path, since the redis
+    # client's round-trips would otherwise block the event loop
+    cache = get_response_cache()
+    miss_indices = list(range(len(operations)))
+    if cache is not None:
+        miss_indices = []
+        for i, (query, variables) in enumerate(operations):
+            try:
+                cached = await asyncio.to_thread(
+                    cache.get, cache_key_for_query(query, variables)
+                )
+            except redis.RedisError as e:
+                print(f"WARNING: Redis cache read failed - {e}", file=sys.stderr)
+                cached = None
+            if cached:
+                results[i] = _loads(cached)
+            else:
+                miss_indices.append(i)
+        if not miss_indices:
+            return results
+
+    payload = [
+        {"query": operations[i][0], "variables": operations[i][1]}
+        for i in miss_indices
+    ]
+
+    try:
+        response = await client.post(MEETUP_API_ENDPOINT, json=payload)
+
+        if response.status_code != 200:
+            # Known-UTF-8 API; decode directly instead of running charset
+            # detection on the error body
+            body = response.content.decode("utf-8", errors="replace")
+            raise Exception(f"HTTP {response.status_code} - {body}")
+
+        data = _loads(response.content)
+
+    except httpx.HTTPError as e:
+        raise Exception(f"Request failed - {e}")
+    except ValueError as e:
+        # Covers both json.JSONDecodeError and orjson.JSONDecodeError
+        raise Exception(f"Failed to parse JSON response - {e}")
+
+    if not isinstance(data, list) or len(data) != len(payload):
+        raise Exception("Batched GraphQL response is not an aligned array")
+
+    # Surface per-operation GraphQL errors the same way the per-query path
+    # does, so callers handle both paths identically; only successful
+    # entries are cached
+    for i, entry in zip(miss_indices, data):
+        if isinstance(entry, dict) and "errors" in entry:
+            results[i] = Exception(f"GraphQL errors: {json.dumps(entry['errors'])}")
+            continue
+        results[i] = entry
+        if cache is not None:
+            try:
+                await asyncio.to_thread(
+                    cache.setex,
+                    cache_key_for_query(*operations[i]),
+                    GRAPHQL_CACHE_TTL_SECONDS,
+                    json.dumps(entry),
+                )
+            except redis.RedisError as e:
+                print(f"WARNING: Redis cache write failed - {e}", file=sys.stderr)
+
+    return results
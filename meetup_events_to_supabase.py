@@ -4,13 +4,15 @@ meetup_events_to_supabase.py
 Fetches Meetup events via GraphQL API and saves them to Supabase.
 
 Requirements:
-    pip install requests python-dotenv supabase
+    pip install httpx python-dotenv supabase
 
 Environment Variables:
     MEETUP_API_TOKEN - Your Meetup OAuth 2.0 access token
     MEETUP_API_ENDPOINT - GraphQL endpoint (default: https://api.meetup.com/gql)
     SUPABASE_URL - Your Supabase project URL
     SUPABASE_SERVICE_ROLE_KEY - Supabase service role key
+    SUPABASE_DB_URL - Optional Postgres DSN; enables the direct bulk-upsert
+        path (requires psycopg2), which is much faster than PostgREST
 
 Usage:
     # Simply run the script - it will fetch all configured locations and topics
@@ -19,16 +21,59 @@ Usage:
     # Or configure locations and topics in the SEARCH_CONFIG section below
 """
 
+import asyncio
+import gzip
 import json
 import os
+import queue
 import sys
-from datetime import datetime
+import threading
 from typing import Dict, Any, List, Optional, TypedDict
 
-import requests
+import httpx
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+# psycopg2 enables bulk upserts over a direct Postgres connection; the
+# PostgREST client remains the fallback when it isn't installed
+try:
+    import psycopg2
+    from psycopg2.extras import Json, execute_values
+except ImportError:
+    psycopg2 = None
+
+# ciso8601 parses ISO-8601 (including the trailing Z) in C, far faster than
+# fromisoformat plus str.replace; fall back when it isn't installed
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+# orjson parses and serializes several times faster than stdlib json; fall
+# back when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# brotli decoding is optional; br is only advertised when the package is
+# installed, since a server honoring it would otherwise send bodies the
+# client can't decode
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Fast path for decoding response bytes (orjson parses 2-5x faster than stdlib)
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_byte_size(obj: Any) -> int:
+    """Serialized JSON size of obj in bytes, using orjson when available."""
+    if orjson is not None:
+        return len(orjson.dumps(obj))
+    return len(json.dumps(obj))
+
 # Meetup API uses MILES (not kilometers) with a silent cap at 100 miles
 MAX_RADIUS_MILES = 100
 
@@ -40,13 +85,128 @@ MEETUP_API_TOKEN = os.getenv("MEETUP_API_TOKEN")
 MEETUP_API_ENDPOINT = os.getenv("MEETUP_API_ENDPOINT", "https://api.meetup.com/gql-ext")
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+SUPABASE_DB_URL = os.getenv("SUPABASE_DB_URL")
+
+# Meetup request headers are constant per process - build them once and set
+# them on the shared client so every request reuses pooled connections
+_MEETUP_HEADERS = {
+    "Authorization": f"Bearer {MEETUP_API_TOKEN}",
+    "Content-Type": "application/json",
+    # GraphQL JSON compresses heavily; advertise brotli alongside gzip, but
+    # only when the optional brotli package is installed - the client can't
+    # decode br bodies without it
+    "Accept-Encoding": "br, gzip, deflate" if brotli is not None else "gzip, deflate",
+}
+
+# Request bodies repeat the ~1.5KB query string on every cursor page, so
+# bodies above this size are gzip-compressed before sending
+_COMPRESS_BODY_THRESHOLD = 1024
 
-# Batch size for Supabase upserts
-BATCH_SIZE = 100
+
+def _encode_request_body(payload: Any) -> tuple:
+    """Serialize payload to bytes, gzipping large bodies.
+
+    Returns:
+        (body bytes, extra headers dict)
+    """
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload).encode()
+    if len(body) > _COMPRESS_BODY_THRESHOLD:
+        return gzip.compress(body, 5), {"Content-Encoding": "gzip"}
+    return body, {}
+
+# Batch size for Supabase upserts; Postgres throughput plateaus around
+# 1000-row batches, so smaller values just waste round trips
+BATCH_SIZE = 1000
+
+# PostgREST bodies are limited to ~1MB by default; a batch is split early
+# when its serialized size would exceed this budget (raw_event blobs vary
+# a lot in size)
+MAX_BATCH_BYTES = 900_000
+
+# Rows per INSERT on the direct Postgres path; bulk-insert throughput
+# plateaus around 1000-row pages
+DB_PAGE_SIZE = 1000
+
+# Fixed column order for the direct Postgres upsert; must match the
+# meetup_events schema and the keys produced by normalize_event
+_UPSERT_COLUMNS = (
+    "id",
+    "title",
+    "description",
+    "event_url",
+    "date_time",
+    "photo_id",
+    "photo_base_url",
+    "group_id",
+    "group_name",
+    "group_urlname",
+    "group_photo_id",
+    "group_photo_base_url",
+    "venue_name",
+    "venue_city",
+    "venue_state",
+    "venue_country",
+    "venue_lat",
+    "venue_lon",
+    "topic_keyword",
+    "raw_event",
+    "search_lat",
+    "search_lon",
+    "search_radius_km",
+)
+
+# Top-level node fields that normalize_event surfaces as their own columns;
+# raw_event keeps only the remainder so the payload isn't shipped twice
+_NORMALIZED_NODE_KEYS = frozenset({
+    "id",
+    "title",
+    "description",
+    "eventUrl",
+    "dateTime",
+    "featuredEventPhoto",
+    "group",
+    "venues",
+})
 
 # Maximum number of pages to fetch (prevents infinite loops)
 MAX_PAGES = 10
 
+# Events requested per page. Every extra page costs a full round trip, so
+# ask for as much as the API will give; if a page size is rejected the
+# search loops halve it and retry (the API historically capped at 100)
+EVENTS_PER_PAGE = 200
+
+# Maximum number of GraphQL requests in flight at once. The (location, topic)
+# searches are independent, so they run concurrently; this cap keeps us
+# within Meetup's rate limits
+CONCURRENT_REQUESTS = 8
+
+# Maximum number of GraphQL operations to pack into one batched HTTP request
+GRAPHQL_BATCH_SIZE = 10
+
+# Bounded retry for transient upstream errors; a single 429/5xx blip should
+# not discard every page fetched so far
+MAX_RETRIES = 5
+RETRY_BACKOFF_SECONDS = 0.5
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# ETag cache keyed by request payload: identical cursor fetches send
+# If-None-Match and reuse the cached parsed body on a 304, skipping the
+# response transfer entirely (wins when re-running during development)
+_ETAG_CACHE: Dict[str, tuple] = {}
+
+# Per-search cursor state persisted between runs, so a recurring job resumes
+# each search from the last fetched page instead of re-fetching everything.
+# Keyed by "<location name>|<topic>" (or "global|<topic>") with the last
+# endCursor and the newest event dateTime seen. The cursor is cleared once a
+# search pages to the end - resuming past the terminal cursor would fetch
+# nothing - and the dateTime then bounds the next run's walk from page 1
+CURSOR_STATE_FILE = ".cursors.json"
+_CURSOR_STATE: Dict[str, Dict[str, Any]] = {}
+
 
 # ============================================================================
 # SEARCH CONFIGURATION
@@ -107,7 +267,10 @@ GLOBAL_TOPICS: List[str] = [
     # "cryptocurrency",
 ]
 
-# GraphQL query for searching events
+# GraphQL query for searching events. The selection set is limited to the
+# fields normalize_event persists - per-edge cursors were fetched and then
+# thrown away, inflating every page. eventType has no column of its own but
+# is kept so raw_event still carries it into the database
 SEARCH_EVENTS_QUERY = """
 query($filter: EventSearchFilter!, $first: Int, $after: String) {
   eventSearch(filter: $filter, first: $first, after: $after) {
@@ -116,7 +279,6 @@ query($filter: EventSearchFilter!, $first: Int, $after: String) {
       endCursor
     }
     edges {
-      cursor
       node {
         id
         title
@@ -167,21 +329,65 @@ def validate_environment() -> None:
         sys.exit(1)
 
 
+def load_cursor_state() -> None:
+    """Load persisted per-search cursors from CURSOR_STATE_FILE."""
+    global _CURSOR_STATE
+    try:
+        with open(CURSOR_STATE_FILE, "rb") as f:
+            _CURSOR_STATE = _loads(f.read())
+    except FileNotFoundError:
+        _CURSOR_STATE = {}
+    except (ValueError, OSError) as e:
+        print(f"⚠ Ignoring unreadable cursor state file {CURSOR_STATE_FILE}: {e}", file=sys.stderr)
+        _CURSOR_STATE = {}
+
+
+def save_cursor_state() -> None:
+    """Persist per-search cursors for the next run."""
+    try:
+        with open(CURSOR_STATE_FILE, "w") as f:
+            json.dump(_CURSOR_STATE, f, indent=2, sort_keys=True)
+    except OSError as e:
+        print(f"⚠ Failed to write cursor state file {CURSOR_STATE_FILE}: {e}", file=sys.stderr)
+
+
+def _saved_cursor(cursor_key: Optional[str]) -> Optional[str]:
+    """Return the persisted endCursor for a search key, if any."""
+    if not cursor_key:
+        return None
+    state = _CURSOR_STATE.get(cursor_key)
+    return state.get("last_cursor") if state else None
+
+
+_SUPABASE_CLIENT: Optional[Client] = None
+
+
 def get_supabase_client() -> Client:
     """
     Initialize and return a Supabase client.
 
+    The client is created once and reused; the upsert consumer calls this
+    per batch, so re-creating it would redo auth setup every time.
+
     Returns:
         Configured Supabase client
     """
-    return create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
+    global _SUPABASE_CLIENT
+    if _SUPABASE_CLIENT is None:
+        _SUPABASE_CLIENT = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
+    return _SUPABASE_CLIENT
 
 
-def run_graphql_query(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+async def run_graphql_query(
+    client: httpx.AsyncClient,
+    query: str,
+    variables: Dict[str, Any],
+) -> Dict[str, Any]:
     """
     Execute a GraphQL query against the Meetup API.
 
     Args:
+        client: Shared httpx async client
         query: GraphQL query string
         variables: Variables to pass to the query
 
@@ -191,50 +397,244 @@ def run_graphql_query(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
     Raises:
         Exception: If the API request fails
     """
-    headers = {
-        "Authorization": f"Bearer {MEETUP_API_TOKEN}",
-        "Content-Type": "application/json",
-    }
-
     payload = {
         "query": query,
         "variables": variables,
     }
 
-    try:
-        response = requests.post(
-            MEETUP_API_ENDPOINT,
-            headers=headers,
-            json=payload,
-            timeout=30,
-        )
+    cache_key = json.dumps(variables, sort_keys=True)
+    body, encoding_headers = _encode_request_body(payload)
+
+    for attempt in range(MAX_RETRIES):
+        headers = dict(encoding_headers)
+        cached = _ETAG_CACHE.get(cache_key)
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+
+        try:
+            response = await client.post(MEETUP_API_ENDPOINT, content=body, headers=headers)
+        except httpx.HTTPError as e:
+            if attempt + 1 < MAX_RETRIES:
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS * (2 ** attempt))
+                continue
+            raise Exception(f"Request failed: {e}")
+
+        # Identical cursor fetch - reuse the cached body without a transfer
+        if response.status_code == 304 and cached is not None:
+            return cached[1]
+
+        if response.status_code in _RETRYABLE_STATUS:
+            if attempt + 1 < MAX_RETRIES:
+                retry_after = response.headers.get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    delay = float(retry_after)
+                else:
+                    delay = RETRY_BACKOFF_SECONDS * (2 ** attempt)
+                await asyncio.sleep(delay)
+                continue
+            raise Exception(f"HTTP {response.status_code}: {response.text}")
 
         if response.status_code != 200:
             raise Exception(f"HTTP {response.status_code}: {response.text}")
 
-        data = response.json()
+        try:
+            data = _loads(response.content)
+        except ValueError as e:
+            # Covers both json.JSONDecodeError and orjson.JSONDecodeError
+            raise Exception(f"Failed to parse JSON response: {e}")
 
         # Check for GraphQL errors
         if "errors" in data:
             error_messages = [err.get("message", str(err)) for err in data["errors"]]
             raise Exception(f"GraphQL errors: {'; '.join(error_messages)}")
 
+        etag = response.headers.get("ETag")
+        if etag:
+            _ETAG_CACHE[cache_key] = (etag, data)
+
         return data
 
-    except requests.exceptions.RequestException as e:
+
+async def run_graphql_batch(
+    client: httpx.AsyncClient,
+    operations: List[tuple],
+) -> List[Dict[str, Any]]:
+    """
+    Execute several GraphQL operations in one HTTP request.
+
+    The endpoint accepts an array of operations per POST, so N searches
+    share one round trip and count as one rate-limit slot.
+
+    Args:
+        client: Shared httpx async client
+        operations: List of (query, variables) tuples
+
+    Returns:
+        List of response dicts, aligned with operations
+
+    Raises:
+        Exception: If the request fails or the response is not a batch array
+    """
+    payload = [{"query": query, "variables": variables} for query, variables in operations]
+    body, encoding_headers = _encode_request_body(payload)
+
+    try:
+        response = await client.post(MEETUP_API_ENDPOINT, content=body, headers=encoding_headers)
+
+        if response.status_code != 200:
+            raise Exception(f"HTTP {response.status_code}: {response.text}")
+
+        data = _loads(response.content)
+
+        if not isinstance(data, list) or len(data) != len(operations):
+            raise Exception("Batched GraphQL response is not an aligned array")
+
+        return data
+
+    except httpx.HTTPError as e:
         raise Exception(f"Request failed: {e}")
-    except json.JSONDecodeError as e:
+    except ValueError as e:
+        # Covers both json.JSONDecodeError and orjson.JSONDecodeError
         raise Exception(f"Failed to parse JSON response: {e}")
 
 
-def normalize_event(
-    raw_node: Dict[str, Any],
-    topic_keyword: Optional[str],
-    search_context: Optional[Dict[str, Any]],
-) -> Dict[str, Any]:
+async def fetch_first_pages(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    variables_list: List[Dict[str, Any]],
+) -> List[Optional[Dict[str, Any]]]:
     """
+    Fetch the first page of several searches via batched requests.
+
+    Args:
+        client: Shared httpx async client
+        semaphore: Semaphore capping concurrent in-flight requests
+        variables_list: One variables dict per search
+
+    Returns:
+        List of eventSearch payloads aligned with variables_list; entries are
+        None when a batch fails, so callers fall back to per-search requests
+    """
+    first_pages: List[Optional[Dict[str, Any]]] = []
+
+    for start in range(0, len(variables_list), GRAPHQL_BATCH_SIZE):
+        chunk = variables_list[start:start + GRAPHQL_BATCH_SIZE]
+        operations = [(SEARCH_EVENTS_QUERY, variables) for variables in chunk]
+
+        try:
+            async with semaphore:
+                responses = await run_graphql_batch(client, operations)
+        except Exception as e:
+            print(f"⚠ Batched first-page request failed, falling back to per-search requests: {e}", file=sys.stderr)
+            first_pages.extend([None] * len(chunk))
+            continue
+
+        # Unpack into a local list appended only when the whole chunk is
+        # processed, so a malformed entry can never leave first_pages
+        # misaligned with variables_list
+        chunk_pages: List[Optional[Dict[str, Any]]] = []
+        for response in responses:
+            # Entry-level GraphQL errors (e.g. a rejected saved cursor)
+            # come back as "errors" with a null "data"; hand just that
+            # search back to the per-search path instead of dying here
+            if not isinstance(response, dict) or "errors" in response:
+                chunk_pages.append(None)
+                continue
+            chunk_pages.append((response.get("data") or {}).get("eventSearch") or None)
+        first_pages.extend(chunk_pages)
+
+    return first_pages
+
+
+def _parse_event_datetime(date_time: Optional[str]) -> Optional[str]:
+    """Normalize a Meetup ISO-8601 dateTime string (None if invalid)."""
+    if not date_time:
+        return None
+    try:
+        if ciso8601 is not None:
+            # Meetup returns ISO 8601 format; ciso8601 validates and
+            # normalizes it in C
+            return ciso8601.parse_datetime(date_time).isoformat()
+        # Normalize the trailing Z without a parse round-trip - Postgres
+        # accepts the +00:00 form directly
+        return date_time.replace("Z", "+00:00")
+    except (ValueError, AttributeError):
+        return None
+
+
+# Column -> access expression for the generated normalize_event. The bound
+# *_get locals are set up in the generated preamble below
+_EVENT_SCHEMA = [
+    ("id", 'node_get("id", "")'),
+    ("title", 'node_get("title", "")'),
+    ("description", 'node_get("description")'),
+    ("event_url", 'node_get("eventUrl")'),
+    ("date_time", '_parse_event_datetime(node_get("dateTime"))'),
+    ("photo_id", 'photo_get("id")'),
+    ("photo_base_url", 'photo_get("baseUrl")'),
+    ("group_id", 'group_get("id")'),
+    ("group_name", 'group_get("name")'),
+    ("group_urlname", 'group_get("urlname")'),
+    ("group_photo_id", 'group_photo_get("id")'),
+    ("group_photo_base_url", 'group_photo_get("baseUrl")'),
+    ("venue_name", 'venue_get("name")'),
+    ("venue_city", 'venue_get("city")'),
+    ("venue_state", 'venue_get("state")'),
+    ("venue_country", 'venue_get("country")'),
+    ("venue_lat", 'venue_get("lat")'),
+    ("venue_lon", 'venue_get("lon")'),
+]
+
+
+def _make_normalize_event():
+    """
+    Generate normalize_event from _EVENT_SCHEMA at import time.
+
+    The schema expands into a single straight-line dict literal, so the
+    per-event cost is fixed-shape construction with no loop over field
+    specs and no repeated attribute lookups at call time. Runs once per
+    event on every page of every search, which makes it the hottest pure-
+    Python code in the module.
+    """
+    lines = [
+        "def normalize_event(raw_node, topic_keyword, search_context):",
+        "    if not raw_node:",
+        "        return None",
+        "    node_get = raw_node.get",
+        '    group_get = (node_get("group") or {}).get',
+        '    venues = node_get("venues") or []',
+        "    venue_get = venues[0].get if venues else {}.get",
+        '    photo_get = (node_get("featuredEventPhoto") or {}).get',
+        '    group_photo_get = (group_get("keyGroupPhoto") or {}).get',
+        "    normalized = {",
+    ]
+    for column, expr in _EVENT_SCHEMA:
+        lines.append(f'        "{column}": {expr},')
+    lines += [
+        '        "topic_keyword": topic_keyword,',
+        # Only fields not already surfaced as columns; storing the whole
+        # node would double the bytes shipped per event for no new data
+        '        "raw_event": {k: v for k, v in raw_node.items() if k not in _NORMALIZED_NODE_KEYS},',
+        "    }",
+        "    if search_context:",
+        '        normalized["search_lat"] = search_context.get("search_lat")',
+        '        normalized["search_lon"] = search_context.get("search_lon")',
+        '        normalized["search_radius_km"] = search_context.get("search_radius_km")',
+        "    return normalized",
+    ]
+
+    namespace = {
+        "_parse_event_datetime": _parse_event_datetime,
+        "_NORMALIZED_NODE_KEYS": _NORMALIZED_NODE_KEYS,
+    }
+    exec("\n".join(lines), namespace)
+
+    generated = namespace["normalize_event"]
+    generated.__doc__ = """
     Normalize a raw GraphQL event node into a database-ready dict.
 
+    Generated from _EVENT_SCHEMA by _make_normalize_event.
+
     Args:
         raw_node: Raw event node from GraphQL response
         topic_keyword: The topic keyword used in the search
@@ -243,84 +643,67 @@ def normalize_event(
     Returns:
         Normalized event dict matching the meetup_events schema
     """
-    # In the new API, the event data is directly in the node (not in result)
-    if not raw_node:
-        return None
+    return generated
 
-    group = raw_node.get("group") or {}
-    # venues is now an array, get the first one
-    venues = raw_node.get("venues") or []
-    venue = venues[0] if venues else {}
 
-    # Extract featured event photo
-    featured_photo = raw_node.get("featuredEventPhoto") or {}
-    photo_id = featured_photo.get("id")
-    photo_base_url = featured_photo.get("baseUrl")
+normalize_event = _make_normalize_event()
 
-    # Extract group photo
-    group_photo = group.get("keyGroupPhoto") or {}
-    group_photo_id = group_photo.get("id")
-    group_photo_base_url = group_photo.get("baseUrl")
 
-    # Parse dateTime
-    date_time = raw_node.get("dateTime")
-    if date_time:
-        try:
-            # Meetup returns ISO 8601 format, parse and convert to timestamp
-            date_time = datetime.fromisoformat(date_time.replace("Z", "+00:00")).isoformat()
-        except (ValueError, AttributeError):
-            date_time = None
-
-    normalized = {
-        "id": raw_node.get("id", ""),
-        "title": raw_node.get("title", ""),
-        "description": raw_node.get("description"),
-        "event_url": raw_node.get("eventUrl"),
-        "date_time": date_time,
-        "photo_id": photo_id,
-        "photo_base_url": photo_base_url,
-        "group_id": group.get("id"),
-        "group_name": group.get("name"),
-        "group_urlname": group.get("urlname"),
-        "group_photo_id": group_photo_id,
-        "group_photo_base_url": group_photo_base_url,
-        "venue_name": venue.get("name"),
-        "venue_city": venue.get("city"),
-        "venue_state": venue.get("state"),
-        "venue_country": venue.get("country"),
-        "venue_lat": venue.get("lat"),
-        "venue_lon": venue.get("lon"),
-        "topic_keyword": topic_keyword,
-        "raw_event": raw_node,
+def build_search_variables(
+    query_keyword: str,
+    lat: float,
+    lon: float,
+    radius_miles: float,
+    after: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build the variables dict for one SEARCH_EVENTS_QUERY page."""
+    return {
+        "filter": {
+            "query": query_keyword,
+            "lat": lat,
+            "lon": lon,
+            "radius": radius_miles,
+        },
+        "first": EVENTS_PER_PAGE,
+        "after": after,
     }
 
-    # Add search context if provided
-    if search_context:
-        normalized["search_lat"] = search_context.get("search_lat")
-        normalized["search_lon"] = search_context.get("search_lon")
-        normalized["search_radius_km"] = search_context.get("search_radius_km")
-
-    return normalized
-
 
-def search_events_by_location(
+async def search_events_by_location(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
     lat: float,
     lon: float,
     radius_miles: float,
     topic_keyword: Optional[str] = None,
+    first_page: Optional[Dict[str, Any]] = None,
+    seen: Optional[set] = None,
+    cursor_key: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """
     Search for events by geographic location.
 
     Args:
+        client: Shared httpx async client
+        semaphore: Semaphore capping concurrent in-flight requests
         lat: Latitude
         lon: Longitude
         radius_miles: Search radius in miles (max 100)
         topic_keyword: Optional topic keyword filter
+        first_page: Optional eventSearch payload for page 1, already fetched
+            as part of a batched request
+        seen: Optional shared set of event IDs; events already in it are
+            skipped and new IDs are added, deduplicating across searches
+        cursor_key: Optional key into the persisted cursor state; when set,
+            the search resumes from the saved endCursor and records the new
+            one for the next run
 
     Returns:
-        List of normalized event dicts
+        List of normalized event dicts, excluding any already in seen
     """
+    if seen is None:
+        seen = set()
+
     # Cap at maximum allowed radius (Meetup API silently caps at 100 miles)
     if radius_miles > MAX_RADIUS_MILES:
         print(f"WARNING: Radius {radius_miles} miles exceeds maximum of {MAX_RADIUS_MILES} miles. Capping at {MAX_RADIUS_MILES} miles.", file=sys.stderr)
@@ -335,51 +718,112 @@ def search_events_by_location(
     # Use provided keyword or a broad default
     query_keyword = topic_keyword if topic_keyword else "events"
 
-    variables = {
-        "filter": {
-            "query": query_keyword,
-            "lat": lat,
-            "lon": lon,
-            "radius": radius_miles,
-        },
-        "first": 100,
-        "after": None,
-    }
+    saved_cursor = _saved_cursor(cursor_key)
+    variables = build_search_variables(query_keyword, lat, lon, radius_miles, after=saved_cursor)
+    resumed = saved_cursor is not None
+
+    last_end_cursor = saved_cursor
+    saved_state = _CURSOR_STATE.get(cursor_key, {}) if cursor_key else {}
+    # Newest event dateTime the previous runs ingested; on a fresh walk it
+    # bounds how far past the old horizon this run pages
+    saved_horizon = saved_state.get("last_seen_datetime")
+    last_seen_datetime = saved_horizon
 
     events = []
     page_count = 0
+    exhausted = False
 
     print(f"Searching events by location (lat={lat}, lon={lon}, radius={radius_miles} miles, topic='{query_keyword}')...")
+    if resumed:
+        print(f"  Resuming from saved cursor ({cursor_key})")
 
     while page_count < MAX_PAGES:
         try:
-            response = run_graphql_query(SEARCH_EVENTS_QUERY, variables)
-            data = response.get("data", {}).get("eventSearch", {})
+            if page_count == 0 and first_page is not None:
+                # Page 1 already arrived as part of a batched request
+                data = first_page
+            else:
+                async with semaphore:
+                    response = await run_graphql_query(client, SEARCH_EVENTS_QUERY, variables)
+                data = response.get("data", {}).get("eventSearch", {})
 
             edges = data.get("edges", [])
+            page_newest = None
             for edge in edges:
                 node = edge.get("node", {})
+                # Dedupe on the raw node id before normalizing -
+                # normalize_event (dict build plus date parse) is the most
+                # expensive per-event call, and duplicates don't need it
+                event_id = node.get("id") if node else None
+                if not event_id or event_id in seen:
+                    continue
+                seen.add(event_id)
+                date_time = node.get("dateTime")
+                if date_time:
+                    if page_newest is None or date_time > page_newest:
+                        page_newest = date_time
+                    if last_seen_datetime is None or date_time > last_seen_datetime:
+                        last_seen_datetime = date_time
                 normalized = normalize_event(node, topic_keyword, search_context)
-                if normalized and normalized.get("id"):
+                if normalized:
                     events.append(normalized)
 
             # Check for pagination
             page_info = data.get("pageInfo", {})
             has_next_page = page_info.get("hasNextPage", False)
             end_cursor = page_info.get("endCursor")
+            if end_cursor:
+                last_end_cursor = end_cursor
 
             page_count += 1
             print(f"  Page {page_count}: fetched {len(edges)} events (total: {len(events)})")
 
             if not has_next_page or not end_cursor:
+                exhausted = True
+                break
+
+            # Pages ascend by dateTime; once a fresh walk has re-covered the
+            # previously ingested window and collected a page beyond it, stop
+            # - each run advances the horizon instead of paging the full tail
+            if not resumed and saved_horizon and page_newest and page_newest > saved_horizon:
+                print(f"  ✓ Caught up past the previous run's newest event, stopping early")
+                exhausted = True
                 break
 
             variables["after"] = end_cursor
 
         except Exception as e:
+            # A cursor persisted from a previous run can expire; restart the
+            # search from page 1 rather than failing outright
+            if resumed and page_count == 0:
+                resumed = False
+                variables["after"] = None
+                print(f"  ⚠ Saved cursor rejected, restarting search from page 1: {e}", file=sys.stderr)
+                continue
+            # Some deployments reject page sizes above 100; halve and retry
+            # the same page before giving up
+            if variables["first"] > 100:
+                variables["first"] //= 2
+                print(f"  ⚠ Page fetch failed, retrying with first={variables['first']}: {e}", file=sys.stderr)
+                continue
             print(f"ERROR fetching page {page_count + 1}: {e}", file=sys.stderr)
             break
 
+    if cursor_key:
+        if exhausted:
+            # Persisting the terminal cursor would make every later run
+            # resume past the end and fetch nothing; restart from page 1
+            # next time and let last_seen_datetime bound that walk
+            _CURSOR_STATE[cursor_key] = {
+                "last_cursor": None,
+                "last_seen_datetime": last_seen_datetime,
+            }
+        elif last_end_cursor:
+            _CURSOR_STATE[cursor_key] = {
+                "last_cursor": last_end_cursor,
+                "last_seen_datetime": last_seen_datetime,
+            }
+
     return events
 
 
@@ -389,24 +833,38 @@ DEFAULT_LON = -122.4194
 DEFAULT_RADIUS_MILES = 62  # ~100km, but capped at API max of 100 miles
 
 
-def search_events_by_topic(
+async def search_events_by_topic(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
     topic_keyword: str,
     lat: Optional[float] = None,
     lon: Optional[float] = None,
     radius_miles: Optional[float] = None,
+    seen: Optional[set] = None,
+    cursor_key: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """
     Search for events by topic keyword, optionally filtered by location.
 
     Args:
+        client: Shared httpx async client
+        semaphore: Semaphore capping concurrent in-flight requests
         topic_keyword: Topic keyword to search for
         lat: Optional latitude for geographic filtering (defaults to SF if not provided)
         lon: Optional longitude for geographic filtering (defaults to SF if not provided)
         radius_miles: Optional search radius in miles (max 100)
+        seen: Optional shared set of event IDs; events already in it are
+            skipped and new IDs are added, deduplicating across searches
+        cursor_key: Optional key into the persisted cursor state; when set,
+            the search resumes from the saved endCursor and records the new
+            one for the next run
 
     Returns:
-        List of normalized event dicts
+        List of normalized event dicts, excluding any already in seen
     """
+    if seen is None:
+        seen = set()
+
     # lat and lon are now required in the new API, use defaults if not provided
     actual_lat = lat if lat is not None else DEFAULT_LAT
     actual_lon = lon if lon is not None else DEFAULT_LON
@@ -423,59 +881,244 @@ def search_events_by_topic(
         "search_radius_miles": actual_radius_miles,
     }
 
-    variables = {
-        "filter": {
-            "query": topic_keyword,
-            "lat": actual_lat,
-            "lon": actual_lon,
-            "radius": actual_radius_miles,
-        },
-        "first": 100,
-        "after": None,
-    }
+    saved_cursor = _saved_cursor(cursor_key)
+    variables = build_search_variables(topic_keyword, actual_lat, actual_lon, actual_radius_miles, after=saved_cursor)
+    resumed = saved_cursor is not None
+
+    last_end_cursor = saved_cursor
+    saved_state = _CURSOR_STATE.get(cursor_key, {}) if cursor_key else {}
+    # Newest event dateTime the previous runs ingested; on a fresh walk it
+    # bounds how far past the old horizon this run pages
+    saved_horizon = saved_state.get("last_seen_datetime")
+    last_seen_datetime = saved_horizon
 
     events = []
     page_count = 0
+    exhausted = False
 
     location_str = f", lat={actual_lat}, lon={actual_lon}, radius={actual_radius_miles} miles"
     print(f"Searching events by topic (topic='{topic_keyword}'{location_str})...")
+    if resumed:
+        print(f"  Resuming from saved cursor ({cursor_key})")
 
     while page_count < MAX_PAGES:
         try:
-            response = run_graphql_query(SEARCH_EVENTS_QUERY, variables)
+            async with semaphore:
+                response = await run_graphql_query(client, SEARCH_EVENTS_QUERY, variables)
             data = response.get("data", {}).get("eventSearch", {})
 
             edges = data.get("edges", [])
+            page_newest = None
             for edge in edges:
                 node = edge.get("node", {})
+                # Dedupe on the raw node id before normalizing -
+                # normalize_event (dict build plus date parse) is the most
+                # expensive per-event call, and duplicates don't need it
+                event_id = node.get("id") if node else None
+                if not event_id or event_id in seen:
+                    continue
+                seen.add(event_id)
+                date_time = node.get("dateTime")
+                if date_time:
+                    if page_newest is None or date_time > page_newest:
+                        page_newest = date_time
+                    if last_seen_datetime is None or date_time > last_seen_datetime:
+                        last_seen_datetime = date_time
                 normalized = normalize_event(node, topic_keyword, search_context)
-                if normalized and normalized.get("id"):
+                if normalized:
                     events.append(normalized)
 
             # Check for pagination
             page_info = data.get("pageInfo", {})
             has_next_page = page_info.get("hasNextPage", False)
             end_cursor = page_info.get("endCursor")
+            if end_cursor:
+                last_end_cursor = end_cursor
 
             page_count += 1
             print(f"  Page {page_count}: fetched {len(edges)} events (total: {len(events)})")
 
             if not has_next_page or not end_cursor:
+                exhausted = True
+                break
+
+            # Pages ascend by dateTime; once a fresh walk has re-covered the
+            # previously ingested window and collected a page beyond it, stop
+            # - each run advances the horizon instead of paging the full tail
+            if not resumed and saved_horizon and page_newest and page_newest > saved_horizon:
+                print(f"  ✓ Caught up past the previous run's newest event, stopping early")
+                exhausted = True
                 break
 
             variables["after"] = end_cursor
 
         except Exception as e:
+            # A cursor persisted from a previous run can expire; restart the
+            # search from page 1 rather than failing outright
+            if resumed and page_count == 0:
+                resumed = False
+                variables["after"] = None
+                print(f"  ⚠ Saved cursor rejected, restarting search from page 1: {e}", file=sys.stderr)
+                continue
+            # Some deployments reject page sizes above 100; halve and retry
+            # the same page before giving up
+            if variables["first"] > 100:
+                variables["first"] //= 2
+                print(f"  ⚠ Page fetch failed, retrying with first={variables['first']}: {e}", file=sys.stderr)
+                continue
             print(f"ERROR fetching page {page_count + 1}: {e}", file=sys.stderr)
             break
 
+    if cursor_key:
+        if exhausted:
+            # Persisting the terminal cursor would make every later run
+            # resume past the end and fetch nothing; restart from page 1
+            # next time and let last_seen_datetime bound that walk
+            _CURSOR_STATE[cursor_key] = {
+                "last_cursor": None,
+                "last_seen_datetime": last_seen_datetime,
+            }
+        elif last_end_cursor:
+            _CURSOR_STATE[cursor_key] = {
+                "last_cursor": last_end_cursor,
+                "last_seen_datetime": last_seen_datetime,
+            }
+
     return events
 
 
+async def search_location(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    location: LocationConfig,
+    seen: Optional[set] = None,
+) -> List[Any]:
+    """
+    Run every topic search for one location, batching their first pages.
+
+    Args:
+        client: Shared httpx async client
+        semaphore: Semaphore capping concurrent in-flight requests
+        location: Location config with lat, lon, radius and topics
+        seen: Optional shared set of event IDs for cross-search dedup
+
+    Returns:
+        Per-topic results aligned with location["topics"]; entries are
+        exceptions when that topic's search failed
+    """
+    lat = location["lat"]
+    lon = location["lon"]
+    radius_miles = min(location["radius_miles"], MAX_RADIUS_MILES)
+    topics = location["topics"]
+
+    # One batched request covers the first page of every topic here, so the
+    # per-topic searches only go back to the network for pages 2+. Saved
+    # cursors go into the batched variables too, so a resumed search's first
+    # request already starts past the pages fetched last run
+    cursor_keys = [f"{location['name']}|{topic}" for topic in topics]
+    variables_list = [
+        build_search_variables(
+            topic if topic else "events", lat, lon, radius_miles,
+            after=_saved_cursor(key),
+        )
+        for topic, key in zip(topics, cursor_keys)
+    ]
+    first_pages = await fetch_first_pages(client, semaphore, variables_list)
+
+    return await asyncio.gather(*[
+        search_events_by_location(
+            client,
+            semaphore,
+            lat=lat,
+            lon=lon,
+            radius_miles=location["radius_miles"],
+            topic_keyword=topic,
+            first_page=first_page,
+            seen=seen,
+            cursor_key=key,
+        )
+        for topic, first_page, key in zip(topics, first_pages, cursor_keys)
+    ], return_exceptions=True)
+
+
+def upsert_events_direct(events: List[Dict[str, Any]]) -> None:
+    """
+    Bulk upsert events over a direct Postgres connection.
+
+    A single INSERT ... ON CONFLICT statement flushed in 1000-row pages via
+    execute_values avoids the per-batch HTTPS and JSON overhead of the
+    PostgREST path, which matters at thousands of rows.
+
+    Args:
+        events: List of normalized event dicts
+
+    Raises:
+        Exception: If the connection or insert fails
+    """
+    columns = ", ".join(_UPSERT_COLUMNS)
+    updates = ", ".join(f"{col} = EXCLUDED.{col}" for col in _UPSERT_COLUMNS if col != "id")
+    sql = (
+        f"INSERT INTO staging_meetup.meetup_events ({columns}) VALUES %s "
+        f"ON CONFLICT (id) DO UPDATE SET {updates}"
+    )
+
+    rows = [
+        tuple(
+            Json(event.get(col)) if col == "raw_event" else event.get(col)
+            for col in _UPSERT_COLUMNS
+        )
+        for event in events
+    ]
+
+    print(f"\nUpserting {len(events)} events over direct Postgres connection...")
+
+    conn = psycopg2.connect(SUPABASE_DB_URL)
+    try:
+        with conn:
+            with conn.cursor() as cur:
+                execute_values(cur, sql, rows, page_size=DB_PAGE_SIZE)
+    finally:
+        conn.close()
+
+    print(f"\n✓ Upsert complete: {len(events)} succeeded, 0 failed")
+
+
+def iter_upsert_batches(events: List[Dict[str, Any]]):
+    """
+    Yield event batches sized for PostgREST.
+
+    Batches are capped at BATCH_SIZE rows and split early when their
+    serialized size would blow the ~1MB PostgREST body limit.
+
+    Args:
+        events: List of normalized event dicts
+
+    Yields:
+        Lists of event dicts
+    """
+    batch: List[Dict[str, Any]] = []
+    batch_bytes = 0
+
+    for event in events:
+        event_bytes = _json_byte_size(event)
+        if batch and (len(batch) >= BATCH_SIZE or batch_bytes + event_bytes > MAX_BATCH_BYTES):
+            yield batch
+            batch = []
+            batch_bytes = 0
+        batch.append(event)
+        batch_bytes += event_bytes
+
+    if batch:
+        yield batch
+
+
 def upsert_events_to_supabase(events: List[Dict[str, Any]]) -> None:
     """
     Upsert events into the Supabase meetup_events table.
 
+    Uses the direct Postgres path when psycopg2 and SUPABASE_DB_URL are
+    available, falling back to batched PostgREST upserts otherwise.
+
     Args:
         events: List of normalized event dicts
 
@@ -486,6 +1129,13 @@ def upsert_events_to_supabase(events: List[Dict[str, Any]]) -> None:
         print("No events to upsert.")
         return
 
+    if psycopg2 is not None and SUPABASE_DB_URL:
+        try:
+            upsert_events_direct(events)
+            return
+        except Exception as e:
+            print(f"⚠ Direct Postgres upsert failed, falling back to PostgREST: {e}", file=sys.stderr)
+
     supabase = get_supabase_client()
 
     total_events = len(events)
@@ -494,11 +1144,8 @@ def upsert_events_to_supabase(events: List[Dict[str, Any]]) -> None:
 
     print(f"\nUpserting {total_events} events to Supabase in batches of {BATCH_SIZE}...")
 
-    # Process in batches
-    for i in range(0, total_events, BATCH_SIZE):
-        batch = events[i:i + BATCH_SIZE]
-        batch_num = (i // BATCH_SIZE) + 1
-
+    # Process in batches capped by both row count and serialized byte size
+    for batch_num, batch in enumerate(iter_upsert_batches(events), start=1):
         try:
             # Upsert the batch
             response = supabase.schema("staging_meetup").table("meetup_events").upsert(batch).execute()
@@ -515,11 +1162,16 @@ def upsert_events_to_supabase(events: List[Dict[str, Any]]) -> None:
     print(f"\n✓ Upsert complete: {succeeded} succeeded, {failed} failed")
 
 
-def main() -> None:
+async def main() -> None:
     """Main entry point - fetches all configured locations and topics."""
     # Validate environment
     validate_environment()
 
+    # Resume each search from where the previous run stopped
+    load_cursor_state()
+    if _CURSOR_STATE:
+        print(f"Loaded cursor state for {len(_CURSOR_STATE)} searches from {CURSOR_STATE_FILE}")
+
     print("=" * 80)
     print("MEETUP EVENTS TO SUPABASE - Configuration-Based Fetch")
     print("=" * 80)
@@ -527,75 +1179,118 @@ def main() -> None:
     print(f"Global topics: {len(GLOBAL_TOPICS)}")
     print()
 
-    all_events = []
-    total_searches = 0
-
-    # Process location-based searches
-    for location in LOCATIONS:
-        location_name = location["name"]
-        lat = location["lat"]
-        lon = location["lon"]
-        radius_miles = location["radius_miles"]
-        topics = location["topics"]
-
-        print(f"\n{'='*80}")
-        print(f"Processing Location: {location_name}")
-        print(f"{'='*80}")
-
-        for topic in topics:
-            total_searches += 1
-            print(f"\n[{total_searches}] Fetching '{topic}' events in {location_name}...")
-
+    # Shared across every search: the event loop is single-threaded, so the
+    # searches can dedupe against one set as they page through results
+    seen_ids: set = set()
+    all_events: List[Dict[str, Any]] = []
+
+    # Upserts run on a consumer thread fed by a bounded queue, so DB writes
+    # overlap with the remaining fetches instead of waiting for all searches
+    # to finish; total runtime approaches max(fetch, write) rather than
+    # fetch + write
+    upsert_queue: "queue.Queue[Optional[List[Dict[str, Any]]]]" = queue.Queue(maxsize=4)
+
+    def upsert_consumer() -> None:
+        while True:
+            batch = upsert_queue.get()
+            if batch is None:
+                break
             try:
-                events = search_events_by_location(
-                    lat=lat,
-                    lon=lon,
-                    radius_miles=radius_miles,
-                    topic_keyword=topic,
-                )
-                all_events.extend(events)
-                print(f"✓ Found {len(events)} events for '{topic}' in {location_name}")
+                upsert_events_to_supabase(batch)
             except Exception as e:
-                print(f"✗ ERROR fetching '{topic}' in {location_name}: {e}", file=sys.stderr)
-
-    # Process global topic searches
-    if GLOBAL_TOPICS:
-        print(f"\n{'='*80}")
-        print("Processing Global Topics (No Location Filter)")
-        print(f"{'='*80}")
+                print(f"✗ Upsert batch failed: {e}", file=sys.stderr)
+            finally:
+                upsert_queue.task_done()
+
+    consumer = threading.Thread(target=upsert_consumer, daemon=True)
+    consumer.start()
+
+    # Each (location, topic) search and each global topic search is
+    # independent, so they run concurrently under the semaphore instead of
+    # serializing their network latencies. Pagination within a single search
+    # stays sequential because it is cursor-based. HTTP/2 multiplexes the
+    # concurrent requests over one TCP+TLS connection instead of opening a
+    # socket per in-flight request.
+    async with httpx.AsyncClient(
+        http2=True,
+        headers=_MEETUP_HEADERS,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+    ) as client:
+        semaphore = asyncio.Semaphore(CONCURRENT_REQUESTS)
+
+        jobs = []
+        job_labels = []
+
+        for location in LOCATIONS:
+            job_labels.append([f"'{topic}' in {location['name']}" for topic in location["topics"]])
+            jobs.append(search_location(client, semaphore, location, seen=seen_ids))
 
         for topic in GLOBAL_TOPICS:
-            total_searches += 1
-            print(f"\n[{total_searches}] Fetching '{topic}' events globally...")
+            job_labels.append([f"'{topic}' globally"])
+            jobs.append(asyncio.gather(
+                search_events_by_topic(
+                    client,
+                    semaphore,
+                    topic_keyword=topic,
+                    seen=seen_ids,
+                    cursor_key=f"global|{topic}",
+                ),
+                return_exceptions=True,
+            ))
+
+        total_searches = sum(len(labels) for labels in job_labels)
+        print(f"Running {total_searches} searches ({CONCURRENT_REQUESTS} concurrent requests max)...\n")
 
+        async def run_job(index: int, job) -> tuple:
             try:
-                events = search_events_by_topic(
-                    topic_keyword=topic,
-                )
-                all_events.extend(events)
-                print(f"✓ Found {len(events)} events for '{topic}' globally")
+                return index, await job
             except Exception as e:
-                print(f"✗ ERROR fetching global '{topic}': {e}", file=sys.stderr)
-
-    # Deduplicate events by ID (in case same event appears in multiple searches)
-    unique_events = {event["id"]: event for event in all_events if event.get("id")}
-    unique_events_list = list(unique_events.values())
+                return index, e
+
+        # The searches dedupe against the shared seen_ids set as they run,
+        # so each job's results are already unique; hand them to the upsert
+        # consumer immediately
+        for future in asyncio.as_completed([run_job(i, job) for i, job in enumerate(jobs)]):
+            index, search_results = await future
+            labels = job_labels[index]
+            if isinstance(search_results, BaseException):
+                # The whole location job failed (e.g. during the batched fetch)
+                search_results = [search_results] * len(labels)
+
+            new_events: List[Dict[str, Any]] = []
+            for label, result in zip(labels, search_results):
+                if isinstance(result, BaseException):
+                    print(f"✗ ERROR fetching {label}: {result}", file=sys.stderr)
+                    continue
+                new_events.extend(result)
+                print(f"✓ Found {len(result)} new events for {label}")
+
+            if new_events:
+                all_events.extend(new_events)
+                # Blocking put runs in a worker thread so a full queue
+                # applies backpressure without stalling the event loop
+                await asyncio.to_thread(upsert_queue.put, new_events)
+
+    # Sentinel stops the consumer once the queue drains
+    upsert_queue.put(None)
+    consumer.join()
+
+    # Persist cursors so the next run only fetches pages added since this one
+    save_cursor_state()
 
     print(f"\n{'='*80}")
     print("DEDUPLICATION SUMMARY")
     print(f"{'='*80}")
-    print(f"Total events fetched: {len(all_events)}")
-    print(f"Unique events: {len(unique_events_list)}")
-    print(f"Duplicates removed: {len(all_events) - len(unique_events_list)}")
+    print(f"Unique events: {len(all_events)} (duplicates skipped during fetch)")
 
-    # Upsert to Supabase
-    if unique_events_list:
-        upsert_events_to_supabase(unique_events_list)
+    # Events were upserted as each search completed; just summarize
+    if all_events:
         print(f"\n{'='*80}")
         print("FINAL SUMMARY")
         print(f"{'='*80}")
         print(f"Total searches performed: {total_searches}")
-        print(f"Unique events upserted to Supabase: {len(unique_events_list)}")
+        print(f"Unique events upserted to Supabase: {len(all_events)}")
         print(f"{'='*80}")
     else:
         print("\n⚠ No events found matching any configured criteria.")
@@ -603,4 +1298,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -18,6 +18,8 @@ import sys
 from typing import Dict, Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
 # Meetup API uses MILES (not kilometers) with a silent cap at 100 miles
@@ -30,12 +32,36 @@ load_dotenv()
 MEETUP_API_TOKEN = os.getenv("MEETUP_API_TOKEN")
 MEETUP_API_ENDPOINT = os.getenv("MEETUP_API_ENDPOINT", "https://api.meetup.com/gql-ext")
 
+# Shared session so TCP connections and TLS sessions are reused across calls
+# instead of paying a fresh handshake per requests.post; transient 429/5xx
+# responses are retried with backoff at the transport layer
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "Authorization": f"Bearer {MEETUP_API_TOKEN}",
+    "Content-Type": "application/json",
+})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=["POST"],
+        ),
+    ),
+)
+
 # San Francisco coordinates
 SF_LAT = 37.7749
 SF_LON = -122.4194
 SF_RADIUS_MILES = 31  # Meetup API uses miles, maximum 100 miles
 
-# GraphQL query for searching events
+# GraphQL query for searching events. Photo nodes, per-edge cursors and
+# eventType are omitted - they aren't used by this script and inflate every
+# page's response
 SEARCH_EVENTS_QUERY = """
 query($filter: EventSearchFilter!, $first: Int, $after: String) {
   eventSearch(filter: $filter, first: $first, after: $after) {
@@ -44,26 +70,16 @@ query($filter: EventSearchFilter!, $first: Int, $after: String) {
       endCursor
     }
     edges {
-      cursor
       node {
         id
         title
         eventUrl
         description
         dateTime
-        eventType
-        featuredEventPhoto {
-          id
-          baseUrl
-        }
         group {
           id
           name
           urlname
-          keyGroupPhoto {
-            id
-            baseUrl
-          }
         }
         venues {
           name
@@ -98,20 +114,14 @@ def run_graphql_query(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
         print("ERROR: MEETUP_API_TOKEN environment variable is not set", file=sys.stderr)
         sys.exit(1)
 
-    headers = {
-        "Authorization": f"Bearer {MEETUP_API_TOKEN}",
-        "Content-Type": "application/json",
-    }
-
     payload = {
         "query": query,
         "variables": variables,
     }
 
     try:
-        response = requests.post(
+        response = _SESSION.post(
             MEETUP_API_ENDPOINT,
-            headers=headers,
             json=payload,
             timeout=30,
         )
@@ -4,35 +4,61 @@ test_meetup_events.py
 Test script to fetch Meetup events using the Meetup GraphQL API and print them as JSON.
 Uses a configuration-based approach - just edit the TEST_QUERIES list below.
 
+The GraphQL transport (config, headers, caching, query/batch execution)
+lives in meetup_core.py; this script supplies the query, the test cases
+and the reporting.
+
 Requirements:
-    pip install requests python-dotenv
+    pip install httpx[http2] python-dotenv
 
 Environment Variables:
     MEETUP_API_TOKEN - Your Meetup OAuth 2.0 access token
     MEETUP_API_ENDPOINT - GraphQL endpoint (default: https://api.meetup.com/gql)
+    REDIS_URL - Optional Redis URL; enables caching of GraphQL responses
+        across runs (requires the redis package)
+    GRAPHQL_CACHE_TTL_SECONDS - Cache TTL for GraphQL responses (default: 1800)
 
 Usage:
     # Simply run the script - it will test all configured queries
     python test_meetup_events.py
 """
 
+import asyncio
+import io
 import json
 import os
 import sys
-from typing import Dict, Any, List, TypedDict, Optional
-
-import requests
-from dotenv import load_dotenv
-
-# Meetup API uses MILES (not kilometers) with a silent cap at 100 miles
-MAX_RADIUS_MILES = 100
-
-# Load environment variables from .env file
-load_dotenv()
-
-# Configuration
-MEETUP_API_TOKEN = os.getenv("MEETUP_API_TOKEN")
-MEETUP_API_ENDPOINT = os.getenv("MEETUP_API_ENDPOINT", "https://api.meetup.com/gql-ext")
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional
+
+import httpx
+
+from meetup_core import (
+    MAX_RADIUS_MILES,
+    MEETUP_API_TOKEN,
+    MEETUP_HEADERS,
+    orjson,
+    run_graphql_batch,
+    run_graphql_query,
+)
+
+# numpy enables vectorized default substitution for the numeric query
+# filters; fall back to per-query dict lookups when it isn't installed
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# fastjsonschema compiles the response schema to a specialized validator
+# function at import; responses are then checked once, letting the summary
+# code index the known shape directly. Optional - skipped when missing
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# Section banner, built once instead of re-multiplying per print
+_BAR80 = "=" * 80
 
 
 # ============================================================================
@@ -42,176 +68,185 @@ MEETUP_API_ENDPOINT = os.getenv("MEETUP_API_ENDPOINT", "https://api.meetup.com/g
 # Simply comment out or remove any queries you don't want to test.
 # ============================================================================
 
-class TestQuery(TypedDict):
+# Frozen + slots keeps each record immutable and makes field access a
+# C-level slot load instead of a dict hash-and-probe per lookup
+@dataclass(slots=True, frozen=True)
+class TestQuery:
     """Configuration for a test query."""
     name: str  # Human-readable name for the test
     topic: str  # Topic keyword to search for
-    lat: Optional[float]  # Optional latitude
-    lon: Optional[float]  # Optional longitude
-    radius_miles: Optional[float]  # Optional search radius in miles (max 100)
+    lat: Optional[float] = None  # Optional latitude
+    lon: Optional[float] = None  # Optional longitude
+    radius_miles: Optional[float] = None  # Optional search radius in miles (max 100)
 
 
 # Define test queries
 # Add or remove queries as needed
 TEST_QUERIES: List[TestQuery] = [
-    {
-        "name": "Data Science and Coffee",
-        "topic": "Data Science and Coffee",
-        "lat": None,
-        "lon": None,
-        "radius_miles": None
-    },
-    {
-        "name": "New York AI Events",
-        "topic": "ai",
-        "lat": 40.7128,
-        "lon": -74.0060,
-        "radius_miles": 31,  # ~50km
-    },
-    {
-        "name": "Austin Python Events",
-        "topic": "python",
-        "lat": 30.2672,
-        "lon": -97.7431,
-        "radius_miles": 25,  # ~40km
-    },
+    TestQuery(
+        name="Data Science and Coffee",
+        topic="Data Science and Coffee",
+    ),
+    TestQuery(
+        name="New York AI Events",
+        topic="ai",
+        lat=40.7128,
+        lon=-74.0060,
+        radius_miles=31,  # ~50km
+    ),
+    TestQuery(
+        name="Austin Python Events",
+        topic="python",
+        lat=30.2672,
+        lon=-97.7431,
+        radius_miles=25,  # ~40km
+    ),
     # Global search (no location filter)
-    # {
-    #     "name": "Global Blockchain Events",
-    #     "topic": "blockchain",
-    #     "lat": None,
-    #     "lon": None,
-    #     "radius_miles": None,
-    # },
+    # TestQuery(
+    #     name="Global Blockchain Events",
+    #     topic="blockchain",
+    # ),
 ]
 
 
-# GraphQL query for searching events
+# Set SUMMARY_ONLY=1 to drop the fields only the FULL JSON OUTPUT dump
+# consumes; the @include directives below then keep descriptions, photos etc.
+# out of the response entirely, so the server sends and the client parses
+# only what the printed summary reads
+FULL_RESULTS = not os.getenv("SUMMARY_ONLY")
+
+# GraphQL query for searching events. Fields beyond the printed summary are
+# gated on $full so summary-only runs transfer a fraction of the bytes
 SEARCH_EVENTS_QUERY = """
-query($filter: EventSearchFilter!, $first: Int, $after: String) {
+query($filter: EventSearchFilter!, $first: Int, $after: String, $full: Boolean!) {
   eventSearch(filter: $filter, first: $first, after: $after) {
     pageInfo {
       hasNextPage
       endCursor
     }
     edges {
-      cursor
+      cursor @include(if: $full)
       node {
         id
         title
-        eventUrl
-        description
-        dateTime
-        eventType
-        featuredEventPhoto {
+        eventUrl @include(if: $full)
+        description @include(if: $full)
+        dateTime @include(if: $full)
+        eventType @include(if: $full)
+        featuredEventPhoto @include(if: $full) {
           id
           baseUrl
         }
         group {
-          id
           name
-          urlname
-          keyGroupPhoto {
+          id @include(if: $full)
+          urlname @include(if: $full)
+          keyGroupPhoto @include(if: $full) {
             id
             baseUrl
           }
         }
         venues {
           name
-          lat
-          lon
           city
-          state
-          country
+          lat @include(if: $full)
+          lon @include(if: $full)
+          state @include(if: $full)
+          country @include(if: $full)
         }
       }
     }
   }
 }
 """
+# Interned so every payload shares one string object for the query text
+SEARCH_EVENTS_QUERY = sys.intern(SEARCH_EVENTS_QUERY)
+
+# Minimal shape every successful response must satisfy; compiled once into
+# a specialized validator so malformed responses fail loudly instead of
+# silently producing empty summaries
+_RESPONSE_SCHEMA = {
+    "type": "object",
+    "required": ["data"],
+    "properties": {
+        "data": {
+            "type": "object",
+            "required": ["eventSearch"],
+            "properties": {
+                "eventSearch": {
+                    "type": "object",
+                    "required": ["edges", "pageInfo"],
+                    "properties": {
+                        "edges": {"type": "array"},
+                        "pageInfo": {"type": "object"},
+                    },
+                },
+            },
+        },
+    },
+}
 
+_validate_response = (
+    fastjsonschema.compile(_RESPONSE_SCHEMA) if fastjsonschema is not None else None
+)
 
-def run_graphql_query(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Execute a GraphQL query against the Meetup API.
 
-    Args:
-        query: GraphQL query string
-        variables: Variables to pass to the query
+# Default location for global searches (San Francisco)
+DEFAULT_LAT = 37.7749
+DEFAULT_LON = -122.4194
+DEFAULT_RADIUS_MILES = 62  # ~100km, but capped at API max of 100 miles
 
-    Returns:
-        JSON response as a dict
 
-    Raises:
-        SystemExit: If the API request fails
+def _build_filter_arrays() -> tuple:
     """
-    if not MEETUP_API_TOKEN:
-        print("ERROR: MEETUP_API_TOKEN environment variable is not set", file=sys.stderr)
-        sys.exit(1)
+    Build parallel arrays of the numeric filter fields (structure-of-arrays).
 
-    headers = {
-        "Authorization": f"Bearer {MEETUP_API_TOKEN}",
-        "Content-Type": "application/json",
-    }
-
-    payload = {
-        "query": query,
-        "variables": variables,
-    }
+    Missing coordinates are substituted with the defaults in one vectorized
+    pass per field at import time, so dispatch only does an indexed read
+    instead of three dict lookups per query. Returns (None, None, None) when
+    numpy isn't installed.
+    """
+    if np is None or not TEST_QUERIES:
+        return None, None, None
 
-    try:
-        response = requests.post(
-            MEETUP_API_ENDPOINT,
-            headers=headers,
-            json=payload,
-            timeout=30,
+    def _column(key: str, default: float) -> "np.ndarray":
+        values = np.array(
+            [getattr(q, key) if getattr(q, key) is not None else np.nan for q in TEST_QUERIES],
+            dtype=np.float64,
         )
+        return np.where(np.isnan(values), default, values)
 
-        if response.status_code != 200:
-            print(
-                f"ERROR: HTTP {response.status_code} - {response.text}",
-                file=sys.stderr,
-            )
-            sys.exit(1)
-
-        data = response.json()
-
-        # Check for GraphQL errors
-        if "errors" in data:
-            print("ERROR: GraphQL errors occurred:", file=sys.stderr)
-            print(json.dumps(data["errors"], indent=2), file=sys.stderr)
-            sys.exit(1)
-
-        return data
-
-    except requests.exceptions.RequestException as e:
-        print(f"ERROR: Request failed - {e}", file=sys.stderr)
-        sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"ERROR: Failed to parse JSON response - {e}", file=sys.stderr)
-        sys.exit(1)
+    return (
+        _column("lat", DEFAULT_LAT),
+        _column("lon", DEFAULT_LON),
+        _column("radius_miles", DEFAULT_RADIUS_MILES),
+    )
 
 
-# Default location for global searches (San Francisco)
-DEFAULT_LAT = 37.7749
-DEFAULT_LON = -122.4194
-DEFAULT_RADIUS_MILES = 62  # ~100km, but capped at API max of 100 miles
+_QUERY_LATS, _QUERY_LONS, _QUERY_RADII = _build_filter_arrays()
 
 
-def fetch_events(test_query: TestQuery) -> Dict[str, Any]:
+def build_event_variables(test_query: TestQuery, index: Optional[int] = None) -> Dict[str, Any]:
     """
-    Fetch events based on a test query configuration.
+    Build the GraphQL variables for a test query configuration.
 
     Args:
         test_query: Test query configuration
+        index: Optional index into TEST_QUERIES; enables the precomputed
+            filter arrays when numpy is available
 
     Returns:
-        GraphQL response containing events
+        Variables dict for SEARCH_EVENTS_QUERY
     """
     # lat and lon are required in the new API
-    lat = test_query.get("lat") if test_query.get("lat") is not None else DEFAULT_LAT
-    lon = test_query.get("lon") if test_query.get("lon") is not None else DEFAULT_LON
-    radius_miles = test_query.get("radius_miles") if test_query.get("radius_miles") is not None else DEFAULT_RADIUS_MILES
+    if _QUERY_LATS is not None and index is not None:
+        lat = float(_QUERY_LATS[index])
+        lon = float(_QUERY_LONS[index])
+        radius_miles = float(_QUERY_RADII[index])
+    else:
+        lat = test_query.lat if test_query.lat is not None else DEFAULT_LAT
+        lon = test_query.lon if test_query.lon is not None else DEFAULT_LON
+        radius_miles = test_query.radius_miles if test_query.radius_miles is not None else DEFAULT_RADIUS_MILES
 
     # Cap at maximum allowed radius (Meetup API silently caps at 100 miles)
     if radius_miles and radius_miles > MAX_RADIUS_MILES:
@@ -219,7 +254,7 @@ def fetch_events(test_query: TestQuery) -> Dict[str, Any]:
         radius_miles = MAX_RADIUS_MILES
 
     filter_config = {
-        "query": test_query["topic"],
+        "query": test_query.topic,
         "lat": lat,
         "lon": lon,
     }
@@ -228,68 +263,185 @@ def fetch_events(test_query: TestQuery) -> Dict[str, Any]:
     if radius_miles:
         filter_config["radius"] = radius_miles
 
-    variables = {
+    return {
         "filter": filter_config,
         "first": 20,
+        "full": FULL_RESULTS,
     }
 
-    return run_graphql_query(SEARCH_EVENTS_QUERY, variables)
+
+async def fetch_events(
+    client: httpx.AsyncClient,
+    test_query: TestQuery,
+    index: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Fetch events based on a test query configuration.
+
+    Args:
+        client: Shared httpx async client
+        test_query: Test query configuration
+        index: Optional index into TEST_QUERIES for the precomputed filters
+
+    Returns:
+        GraphQL response containing events
+    """
+    return await run_graphql_query(client, SEARCH_EVENTS_QUERY, build_event_variables(test_query, index))
+
+
+# (local name, access expression) pairs for the generated summary extractor;
+# the node/group/venue locals are bound in the generated preamble below
+_SUMMARY_SCHEMA = [
+    ("title", 'node["title"]'),
+    ("group_name", 'group["name"]'),
+    ("venue_name", 'venue["name"]'),
+    ("city", 'venue["city"]'),
+]
+
+
+def _make_summary_extractor():
+    """
+    Generate the per-edge summary extractor from _SUMMARY_SCHEMA at import.
+
+    The response shape is fixed, so the generated function does straight-line
+    direct indexing with per-field KeyError fallbacks instead of generic
+    .get() chains that hash keys and allocate default dicts on every call.
+    """
+    lines = [
+        "def extract_summary(edge):",
+        '    node = edge.get("node") or {}',
+        '    group = node.get("group") or {}',
+        '    venues = node.get("venues")',
+        "    venue = venues[0] if venues else {}",
+    ]
+    for name, expr in _SUMMARY_SCHEMA:
+        lines += [
+            "    try:",
+            f"        {name} = {expr}",
+            "    except KeyError:",
+            f'        {name} = "N/A"',
+        ]
+    lines.append(f"    return {', '.join(name for name, _ in _SUMMARY_SCHEMA)}")
+
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+
+    generated = namespace["extract_summary"]
+    generated.__doc__ = """
+    Extract the summary fields from one event edge.
+
+    Generated from _SUMMARY_SCHEMA by _make_summary_extractor.
+
+    Args:
+        edge: Event edge from the GraphQL response
+
+    Returns:
+        (title, group_name, venue_name, city) tuple
+    """
+    return generated
+
+
+extract_summary = _make_summary_extractor()
 
 
 def print_event_summary(events_data: Dict[str, Any]) -> None:
     """
     Print a summary of events from the response.
 
+    The summary is rendered into one buffer and written with a single
+    stdout write instead of dozens of individually flushed prints.
+
     Args:
         events_data: GraphQL response data
     """
-    event_search = events_data.get("data", {}).get("eventSearch", {})
-    edges = event_search.get("edges", [])
+    if _validate_response is not None:
+        # Shape was validated after the fetch - index the known path directly
+        edges = events_data["data"]["eventSearch"]["edges"]
+    else:
+        edges = events_data.get("data", {}).get("eventSearch", {}).get("edges", [])
 
-    print(f"\nEvents returned in this response: {len(edges)}\n")
+    buf = io.StringIO()
+    print(f"\nEvents returned in this response: {len(edges)}\n", file=buf)
 
     if edges:
-        print("Sample events:")
-        print("-" * 80)
+        print("Sample events:", file=buf)
+        print("-" * 80, file=buf)
         for i, edge in enumerate(edges[:5], 1):  # Show first 5 events
-            event = edge.get("node", {})
-            title = event.get("title", "N/A")
-            group_name = event.get("group", {}).get("name", "N/A")
-            venues = event.get("venues", [])
-            venue = venues[0] if venues else {}
-            venue_name = venue.get("name", "N/A")
-            city = venue.get("city", "N/A")
-
-            print(f"{i}. {title}")
-            print(f"   Group: {group_name}")
-            print(f"   Venue: {venue_name}, {city}")
-            print()
+            title, group_name, venue_name, city = extract_summary(edge)
 
+            print(f"{i}. {title}", file=buf)
+            print(f"   Group: {group_name}", file=buf)
+            print(f"   Venue: {venue_name}, {city}", file=buf)
+            print(file=buf)
 
-def main() -> None:
-    """Main entry point - runs all configured test queries."""
-    print("=" * 80)
+    sys.stdout.write(buf.getvalue())
+
+
+async def main() -> None:
+    """Main entry point - runs all configured test queries concurrently."""
+    # Per-event summaries are for humans watching a terminal; piped/CI runs
+    # (or QUIET=1) keep only the JSON dump and the pass/fail reporting
+    verbose = sys.stdout.isatty() and not os.getenv("QUIET")
+
+    # Bound once; re-evaluated repeatedly below otherwise
+    num_queries = len(TEST_QUERIES)
+
+    print(_BAR80)
     print("MEETUP API TEST - Configuration-Based Testing")
-    print("=" * 80)
-    print(f"\nConfigured test queries: {len(TEST_QUERIES)}\n")
+    print(_BAR80)
+    print(f"\nConfigured test queries: {num_queries}\n")
 
     if not TEST_QUERIES:
         print("⚠ No test queries configured!")
         print("Edit TEST_QUERIES in this script to add test cases.")
         sys.exit(0)
 
-    all_results = []
+    if not MEETUP_API_TOKEN:
+        print("ERROR: MEETUP_API_TOKEN environment variable is not set", file=sys.stderr)
+        sys.exit(1)
+
+    # The queries are independent and I/O-bound, so they share one client:
+    # preferably as a single array-batched POST (one round trip for all of
+    # them), otherwise fired concurrently so wall time is the slowest query
+    # rather than the sum of all of them. HTTP/2 multiplexes the concurrent
+    # fallback requests over one TCP+TLS connection, so there is exactly one
+    # handshake however many queries run
+    async with httpx.AsyncClient(
+        http2=True,
+        headers=MEETUP_HEADERS,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=4, max_connections=num_queries),
+    ) as client:
+        try:
+            operations = [
+                (SEARCH_EVENTS_QUERY, build_event_variables(test_query, i))
+                for i, test_query in enumerate(TEST_QUERIES)
+            ]
+            results = await run_graphql_batch(client, operations)
+        except Exception as e:
+            print(f"⚠ Batched request failed, falling back to per-query requests: {e}", file=sys.stderr)
+            results = await asyncio.gather(
+                *(fetch_events(client, test_query, i) for i, test_query in enumerate(TEST_QUERIES)),
+                return_exceptions=True,
+            )
 
-    for i, test_query in enumerate(TEST_QUERIES, 1):
-        test_name = test_query["name"]
-        topic = test_query["topic"]
-        lat = test_query.get("lat")
-        lon = test_query.get("lon")
-        radius_miles = test_query.get("radius_miles")
+    # Preallocated so per-test assignment is an index store, with the
+    # success/failure tallies folded into the same pass instead of two
+    # extra traversals at the end
+    all_results: List[Optional[Dict[str, Any]]] = [None] * num_queries
+    successful = 0
+    failed = 0
 
-        print(f"\n{'='*80}")
-        print(f"Test {i}/{len(TEST_QUERIES)}: {test_name}")
-        print(f"{'='*80}")
+    for i, (test_query, result) in enumerate(zip(TEST_QUERIES, results), 1):
+        test_name = test_query.name
+        topic = test_query.topic
+        lat = test_query.lat
+        lon = test_query.lon
+        radius_miles = test_query.radius_miles
+
+        print("\n" + _BAR80)
+        print(f"Test {i}/{num_queries}: {test_name}")
+        print(_BAR80)
 
         if lat and lon and radius_miles:
             actual_radius = min(radius_miles, MAX_RADIUS_MILES)
@@ -297,43 +449,68 @@ def main() -> None:
         else:
             print(f"Topic: '{topic}' | Location: Global (no location filter)")
 
-        try:
-            result = fetch_events(test_query)
-            all_results.append({
+        # Reject responses that don't match the expected shape up front so
+        # they surface as failures instead of empty summaries
+        if not isinstance(result, BaseException) and _validate_response is not None:
+            try:
+                _validate_response(result)
+            except fastjsonschema.JsonSchemaException as e:
+                result = Exception(f"Response failed schema validation: {e}")
+
+        if isinstance(result, BaseException):
+            failed += 1
+            print(f"✗ Test '{test_name}' FAILED: {result}", file=sys.stderr)
+            all_results[i - 1] = {
                 "test_name": test_name,
-                "query": test_query,
+                "query": asdict(test_query),
+                "error": str(result),
+            }
+        else:
+            successful += 1
+            all_results[i - 1] = {
+                "test_name": test_name,
+                "query": asdict(test_query),
                 "result": result,
-            })
+            }
 
-            print_event_summary(result)
+            if verbose:
+                print_event_summary(result)
             print(f"✓ Test '{test_name}' completed successfully")
 
-        except Exception as e:
-            print(f"✗ Test '{test_name}' FAILED: {e}", file=sys.stderr)
-            all_results.append({
-                "test_name": test_name,
-                "query": test_query,
-                "error": str(e),
-            })
-
-    # Print full JSON output
-    print(f"\n{'='*80}")
-    print("FULL JSON OUTPUT")
-    print(f"{'='*80}\n")
-    print(json.dumps(all_results, indent=2))
+    # Print full JSON output. QUIET=1 skips the serialization entirely -
+    # the dump is by far the largest chunk of output and of post-fetch CPU
+    if os.getenv("QUIET"):
+        print("\n(QUIET=1 - full JSON output skipped)")
+    else:
+        print("\n" + _BAR80)
+        print("FULL JSON OUTPUT")
+        print(_BAR80 + "\n")
+        if orjson is not None:
+            # Serialize one result at a time so the combined dump never
+            # exists as a single giant string on top of all_results itself
+            write = sys.stdout.buffer.write
+            write(b"[\n")
+            last = len(all_results) - 1
+            for i, result_entry in enumerate(all_results):
+                write(orjson.dumps(result_entry, option=orjson.OPT_INDENT_2))
+                write(b",\n" if i < last else b"\n")
+            write(b"]\n")
+            sys.stdout.buffer.flush()
+        else:
+            # json.dump writes incrementally instead of materializing the
+            # string
+            json.dump(all_results, sys.stdout, indent=2)
+            print()
 
     # Print summary
-    successful = sum(1 for r in all_results if "result" in r)
-    failed = sum(1 for r in all_results if "error" in r)
-
-    print(f"\n{'='*80}")
+    print("\n" + _BAR80)
     print("TEST SUMMARY")
-    print(f"{'='*80}")
-    print(f"Total tests: {len(TEST_QUERIES)}")
+    print(_BAR80)
+    print(f"Total tests: {num_queries}")
     print(f"Successful: {successful}")
     print(f"Failed: {failed}")
-    print(f"{'='*80}\n")
+    print(_BAR80 + "\n")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())